@@ -10,11 +10,32 @@ This package provides tools for:
 - Generating documentation from topology declarations
 """
 
+import importlib
+from typing import TYPE_CHECKING, Any
+
 __version__ = "0.1.0"
 
-from infralink.core.registry import Registry
-from infralink.core.edges import EdgeSet, Edge
-from infralink.core.resolver import EdgeResolver
+# Prefer the libyaml-backed C loader/dumper when PyYAML was built with it
+try:
+    from yaml import CSafeDumper as _Dumper
+    from yaml import CSafeLoader as _Loader
+except ImportError:  # pragma: no cover - depends on PyYAML build
+    from yaml import SafeDumper as _Dumper  # type: ignore[assignment]
+    from yaml import SafeLoader as _Loader  # type: ignore[assignment]
+
+if TYPE_CHECKING:
+    from infralink.core.edges import Edge, EdgeSet
+    from infralink.core.registry import Registry
+    from infralink.core.resolver import EdgeResolver
+
+# Public names -> defining module; imported on first access so that CLI help and
+# completion paths do not pay for pydantic and the schema models
+_LAZY_IMPORTS = {
+    "Registry": "infralink.core.registry",
+    "EdgeSet": "infralink.core.edges",
+    "Edge": "infralink.core.edges",
+    "EdgeResolver": "infralink.core.resolver",
+}
 
 __all__ = [
     "__version__",
@@ -23,3 +44,12 @@ __all__ = [
     "Edge",
     "EdgeResolver",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_path = _LAZY_IMPORTS.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_path), name)
+    globals()[name] = value
+    return value
@@ -2,6 +2,14 @@
 
 from __future__ import annotations
 
+import io
+import json
+import re
+from collections import defaultdict
+from collections.abc import Mapping
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import groupby
 from pathlib import Path
 from typing import Any
 
@@ -10,23 +18,92 @@ import yaml
 from rich.console import Console
 from rich.table import Table
 
-console = Console()
+from infralink import _Dumper
+from infralink.cli.main import Context, pass_context
 
+console = Console()
 
-def convert_to_uuid_primary(data: dict[str, Any]) -> dict[str, Any]:
+# Standard exporter ports
+_EXPORTER_PORTS: Mapping[str, int] = {
+    "node-exporter": 9100,
+    "cadvisor": 8080,
+    "mysqld-exporter": 9104,
+    "postgres-exporter": 9187,
+    "redis-exporter": 9121,
+    "nginx-exporter": 9113,
+    "nginx-vts-exporter": 9913,
+    "php-fpm-exporter": 9253,
+    "elasticsearch-exporter": 9114,
+    "airflow-exporter": 9112,
+    "postfix-exporter": 9154,
+    "dcgm-exporter": 9400,
+}
+
+# Characters that can appear in a plain (unquoted) YAML scalar without escaping
+_PLAIN_SCALAR = re.compile(r"[A-Za-z0-9_][A-Za-z0-9_./-]*")
+_STR_TAG = "tag:yaml.org,2002:str"
+_resolver = yaml.resolver.Resolver()
+
+# Dependency targets inferred as database edges (everything else is a queue)
+_DB_SERVICES: frozenset[str] = frozenset({"mariadb", "mysql", "postgresql", "postgres"})
+
+
+@dataclass(slots=True, frozen=True)
+class HostRow:
+    """Fields of one production registry host, extracted once after load."""
+
+    name: str
+    uuid: str | None
+    canonical: str
+    status: str | None
+    group: str
+    services: tuple[str, ...]
+    obs: dict[str, Any]
+    deps: dict[str, list[dict[str, Any]]]
+    data: dict[str, Any]
+
+
+def index_hosts(
+    hosts: dict[str, Any],
+) -> tuple[list[HostRow], dict[str, list[HostRow]]]:
+    """Build the per-host rows shared by all analysis helpers from the ``hosts`` mapping.
+
+    Returns the rows in registry order plus a service name -> rows index.
+    """
+    rows = []
+    services_index: dict[str, list[HostRow]] = defaultdict(list)
+    for name, host_data in hosts.items():
+        row = HostRow(
+            name=name,
+            uuid=host_data.get("uuid"),
+            canonical=host_data.get("canonical_name", name),
+            status=host_data.get("status"),
+            group=host_data.get("group", "ungrouped"),
+            services=tuple(host_data.get("services") or ()),
+            obs=host_data.get("observability") or {},
+            deps=host_data.get("service_dependencies") or {},
+            data=host_data,
+        )
+        rows.append(row)
+        for service in row.services:
+            services_index[service].append(row)
+    return rows, services_index
+
+
+def convert_to_uuid_primary(rows: list[HostRow], data: dict[str, Any]) -> dict[str, Any]:
     """Convert old format (name key + uuid field) to UUID-as-primary format."""
     new_hosts = {}
-    for name, host_data in data.get("hosts", {}).items():
-        uuid = host_data.get("uuid")
-        if not uuid:
-            console.print(f"[yellow]Warning: Host {name} has no UUID, skipping[/yellow]")
+    for row in rows:
+        if not row.uuid:
+            console.print(f"[yellow]Warning: Host {row.name} has no UUID, skipping[/yellow]")
             continue
         # Remove uuid from data since it's now the key
-        host_copy = {k: v for k, v in host_data.items() if k != "uuid"}
+        host_copy = row.data.copy()
+        host_copy.pop("uuid", None)
         # Ensure canonical_name exists
         if "canonical_name" not in host_copy:
-            host_copy["canonical_name"] = name
-        new_hosts[uuid] = host_copy
+            host_copy["canonical_name"] = row.name
+        new_hosts[row.uuid] = host_copy
 
     return {
         "hosts": new_hosts,
@@ -34,15 +111,15 @@ def convert_to_uuid_primary(data: dict[str, Any]) -> dict[str, Any]:
     }
 
 
-def infer_edges_from_dependencies(data: dict[str, Any]) -> list[dict[str, Any]]:
+def infer_edges_from_dependencies(rows: list[HostRow]) -> list[dict[str, Any]]:
     """Extract edges from service_dependencies declarations."""
     edges = []
 
-    for name, host_data in data.get("hosts", {}).items():
-        source_uuid = host_data.get("uuid")
-        deps = host_data.get("service_dependencies", {})
+    for row in rows:
+        source_uuid = row.uuid
 
-        for service, dep_list in deps.items():
+        for service, dep_list in row.deps.items():
+            id_prefix = f"{row.canonical}-{service}-to-"
             for dep in dep_list:
                 target_host = dep.get("host")
                 target_service = dep.get("service")
@@ -55,10 +132,9 @@ def infer_edges_from_dependencies(data: dict[str, Any]) -> list[dict[str, Any]]:
                 if target_host.startswith("cloudsql:"):
                     continue
 
-                edge_id = f"{host_data.get('canonical_name', name)}-{service}-to-{target_service}"
                 edges.append({
-                    "id": edge_id,
-                    "type": "database" if target_service in ("mariadb", "mysql", "postgresql", "postgres") else "queue",
+                    "id": id_prefix + target_service,
+                    "type": "database" if target_service in _DB_SERVICES else "queue",
                     "from": {
                         "hosts": [source_uuid],
                         "service": service,
@@ -77,100 +153,147 @@ def infer_edges_from_dependencies(data: dict[str, Any]) -> list[dict[str, Any]]:
     return edges
 
 
-def infer_monitoring_edges(data: dict[str, Any], prometheus_uuid: str | None) -> list[dict[str, Any]]:
+def infer_monitoring_edges(
+    active_rows: list[HostRow], prometheus_uuid: str | None
+) -> list[dict[str, Any]]:
     """Infer prometheus scrape edges from observability declarations."""
     if not prometheus_uuid:
         return []
 
     edges = []
+    get_port = _EXPORTER_PORTS.get
 
-    for name, host_data in data.get("hosts", {}).items():
-        if host_data.get("status") != "active":
-            continue
-
-        target_uuid = host_data.get("uuid")
-        obs = host_data.get("observability", {})
-        managed = obs.get("managed_services", [])
-
-        # Standard exporter ports
-        exporter_ports = {
-            "node-exporter": 9100,
-            "cadvisor": 8080,
-            "mysqld-exporter": 9104,
-            "postgres-exporter": 9187,
-            "redis-exporter": 9121,
-            "nginx-exporter": 9113,
-            "nginx-vts-exporter": 9913,
-            "php-fpm-exporter": 9253,
-            "elasticsearch-exporter": 9114,
-            "airflow-exporter": 9112,
-            "postfix-exporter": 9154,
-            "dcgm-exporter": 9400,
-        }
+    for row in active_rows:
+        target_uuid = row.uuid
+        obs = row.obs
+        managed = obs.get("managed_services") or ()
 
         # Check for port overrides
-        overrides = obs.get("port_overrides", {})
+        overrides = obs.get("port_overrides") or {}
+        id_prefix = f"prometheus-to-{row.canonical}-"
 
         for service in managed:
-            if service in exporter_ports or service.endswith("-exporter"):
-                port = overrides.get(service) or exporter_ports.get(service, 9100)
-                edge_id = f"prometheus-to-{host_data.get('canonical_name', name)}-{service}"
-                edges.append({
-                    "id": edge_id,
-                    "type": "monitoring",
-                    "from": {
-                        "hosts": [prometheus_uuid],
-                        "service": "prometheus",
-                    },
-                    "to": {
-                        "host": target_uuid,
-                        "service": service,
-                        "port": port,
-                    },
-                    "metadata": {
-                        "source": "observability.managed_services",
-                    },
-                })
+            default_port = get_port(service)
+            if default_port is None and not service.endswith("-exporter"):
+                continue
+            port = overrides.get(service) or default_port or 9100
+            edges.append({
+                "id": id_prefix + service,
+                "type": "monitoring",
+                "from": {
+                    "hosts": [prometheus_uuid],
+                    "service": "prometheus",
+                },
+                "to": {
+                    "host": target_uuid,
+                    "service": service,
+                    "port": port,
+                },
+                "metadata": {
+                    "source": "observability.managed_services",
+                },
+            })
 
     return edges
 
 
-def generate_mermaid_diagram(data: dict[str, Any], edges: list[dict[str, Any]]) -> str:
+@lru_cache(maxsize=4096)
+def _yaml_str(value: str) -> str:
+    """Render a string as a YAML scalar, quoting only when a plain scalar would not round-trip."""
+    if _PLAIN_SCALAR.fullmatch(value) and (
+        _resolver.resolve(yaml.ScalarNode, value, (True, False)) == _STR_TAG
+    ):
+        return value
+    if value.isascii() and value.isprintable():
+        return "'" + value.replace("'", "''") + "'"
+    # JSON strings are valid YAML double-quoted scalars
+    return json.dumps(value)
+
+
+def _yaml_scalar(value: Any) -> str:
+    """Render a leaf value of an inferred edge as a YAML scalar."""
+    if isinstance(value, str):
+        return _yaml_str(value)
+    if value is None:
+        return "null"
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, int):
+        return str(value)
+    # Anything else (floats, dates, nested notes) goes through the generic emitter in flow style
+    dumped: str = yaml.dump(value, Dumper=_Dumper, default_flow_style=True, width=1 << 30)
+    return dumped.rstrip("\n").removesuffix("\n...")
+
+
+def _dump_edges(edges_data: dict[str, Any]) -> str:
+    """Serialize inferred edges to YAML.
+
+    Written directly for the fixed edge schema, skipping the generic representer
+    and emitter. The output loads back to ``edges_data``; it is not byte-identical
+    to ``yaml.dump``, whose quoting differs for values such as ``"foo bar"``,
+    ``"-x"`` and non-ASCII strings.
+    """
+    buf = io.StringIO()
+    write = buf.write
+    scalar = _yaml_scalar
+    write(f"schema_version: {scalar(edges_data['schema_version'])}\n")
+    edge_list = edges_data["edges"]
+    if not edge_list:
+        write("edges: []\n")
+        return buf.getvalue()
+    write("edges:\n")
+    for edge in edge_list:
+        src = edge["from"]
+        to = edge["to"]
+        write(f"- id: {scalar(edge['id'])}\n  type: {scalar(edge['type'])}\n  from:\n")
+        if src["hosts"]:
+            write("    hosts:\n")
+            for host in src["hosts"]:
+                write(f"    - {scalar(host)}\n")
+        else:
+            write("    hosts: []\n")
+        write(
+            f"    service: {scalar(src['service'])}\n"
+            f"  to:\n"
+            f"    host: {scalar(to['host'])}\n"
+            f"    service: {scalar(to['service'])}\n"
+            f"    port: {scalar(to['port'])}\n"
+        )
+        if "metadata" not in edge:
+            continue
+        metadata = edge["metadata"]
+        if not metadata:
+            write("  metadata: {}\n")
+            continue
+        write("  metadata:\n")
+        for key, value in metadata.items():
+            write(f"    {key}: {scalar(value)}\n")
+    return buf.getvalue()
+
+
+def generate_mermaid_diagram(active_rows: list[HostRow], edges: list[dict[str, Any]]) -> str:
     """Generate Mermaid diagram from registry and edges."""
     lines = ["graph LR"]
 
-    # Group hosts by group
-    groups: dict[str, list[tuple[str, dict]]] = {}
-    for name, host_data in data.get("hosts", {}).items():
-        if host_data.get("status") != "active":
-            continue
-        group = host_data.get("group", "ungrouped")
-        if group not in groups:
-            groups[group] = []
-        groups[group].append((name, host_data))
-
-    # Add subgraphs for each group
-    for group, hosts in sorted(groups.items()):
+    # Add a subgraph for each group (stable sort keeps registry order within a group)
+    by_group = sorted(active_rows, key=lambda r: r.group)
+    for group, rows in groupby(by_group, key=lambda r: r.group):
         lines.append(f"    subgraph {group}")
-        for name, host_data in hosts:
-            uuid_short = host_data.get("uuid", "")[:8]
-            canonical = host_data.get("canonical_name", name)
-            services = host_data.get("services", [])[:3]  # Top 3 services
+        for row in rows:
+            uuid_short = (row.uuid or "")[:8]
+            services = row.services[:3]  # Top 3 services
             svc_str = ", ".join(services) if services else "no services"
-            lines.append(f'        {uuid_short}["{canonical}<br/>{svc_str}"]')
+            lines.append(f'        {uuid_short}["{row.canonical}<br/>{svc_str}"]')
         lines.append("    end")
 
-    # Add edges
+    # Add edges (all inferred edges carry type, from and to)
     for edge in edges:
-        from_hosts = edge.get("from", {}).get("hosts", [])
-        to_host = edge.get("to", {}).get("host", "")
-        to_service = edge.get("to", {}).get("service", "")
-        edge_type = edge.get("type", "")
+        to = edge["to"]
+        label = f"{edge['type']}:{to['service']}"
+        to_short = to["host"][:8]
 
-        for from_host in from_hosts:
-            from_short = from_host[:8]
-            to_short = to_host[:8]
-            lines.append(f"    {from_short} -->|{edge_type}:{to_service}| {to_short}")
+        for from_host in edge["from"]["hosts"]:
+            lines.append(f"    {from_host[:8]} -->|{label}| {to_short}")
 
     return "\n".join(lines)
 
@@ -191,7 +314,9 @@ def generate_mermaid_diagram(data: dict[str, Any], edges: list[dict[str, Any]])
 @click.option("--edges/--no-edges", default=True, help="Generate edges.yml")
 @click.option("--diagram/--no-diagram", default=True, help="Generate diagram")
 @click.option("--monitoring/--no-monitoring", default=True, help="Include monitoring edges")
+@pass_context
 def analyze(
+    ctx: Context,
     registry: Path,
     output: Path,
     edges: bool,
@@ -207,40 +332,42 @@ def analyze(
     """
     # Load prod registry
     console.print(f"[cyan]Loading registry from {registry}[/cyan]")
-    with registry.open() as f:
-        data = yaml.safe_load(f)
+    data = ctx.load_raw(registry)
+    hosts: dict[str, Any] = data.get("hosts") or {}
+
+    rows, services_index = index_hosts(hosts)
+    active_rows = [r for r in rows if r.status == "active"]
 
     # Stats
-    total_hosts = len(data.get("hosts", {}))
-    active_hosts = sum(1 for h in data.get("hosts", {}).values() if h.get("status") == "active")
-    console.print(f"  Total hosts: {total_hosts}")
-    console.print(f"  Active hosts: {active_hosts}")
+    console.print(f"  Total hosts: {len(rows)}")
+    console.print(f"  Active hosts: {len(active_rows)}")
 
     # Find prometheus host
     prometheus_uuid = None
-    for name, host_data in data.get("hosts", {}).items():
-        if "prometheus" in host_data.get("services", []):
-            prometheus_uuid = host_data.get("uuid")
-            console.print(f"  Prometheus host: {host_data.get('canonical_name')} ({prometheus_uuid[:8]}...)")
-            break
+    prom_rows = services_index.get("prometheus")
+    if prom_rows:
+        prometheus_uuid = prom_rows[0].uuid
+        console.print(f"  Prometheus host: {prom_rows[0].canonical} ({prometheus_uuid[:8]}...)")
 
     # Create output directory
     output.mkdir(parents=True, exist_ok=True)
 
     # Convert to UUID-primary format
-    converted = convert_to_uuid_primary(data)
+    converted = convert_to_uuid_primary(rows, data)
     converted_path = output / "registry.yml"
-    with converted_path.open("w") as f:
-        yaml.dump(converted, f, default_flow_style=False, sort_keys=False)
+    converted_path.write_text(
+        yaml.dump(converted, Dumper=_Dumper, default_flow_style=False, sort_keys=False),
+        encoding="utf-8",
+    )
     console.print(f"[green]Wrote {converted_path}[/green]")
 
     # Generate edges
     if edges:
-        edge_list = infer_edges_from_dependencies(data)
+        edge_list = infer_edges_from_dependencies(rows)
         console.print(f"  Inferred {len(edge_list)} edges from service_dependencies")
 
         if monitoring and prometheus_uuid:
-            mon_edges = infer_monitoring_edges(data, prometheus_uuid)
+            mon_edges = infer_monitoring_edges(active_rows, prometheus_uuid)
             console.print(f"  Inferred {len(mon_edges)} monitoring edges")
             edge_list.extend(mon_edges)
 
@@ -249,8 +376,7 @@ def analyze(
             "edges": edge_list,
         }
         edges_path = output / "edges.yml"
-        with edges_path.open("w") as f:
-            yaml.dump(edges_data, f, default_flow_style=False, sort_keys=False)
+        edges_path.write_text(_dump_edges(edges_data), encoding="utf-8")
         console.print(f"[green]Wrote {edges_path}[/green]")
 
         # Show edge summary
@@ -266,7 +392,7 @@ def analyze(
                     e["id"][:40],
                     e["type"],
                     f"{e['to']['service']}:{e['to']['port']}",
-                    e.get("metadata", {}).get("source", ""),
+                    e["metadata"].get("source", ""),
                 )
             console.print(table)
             if len(edge_list) > 20:
@@ -274,21 +400,28 @@ def analyze(
 
     # Generate diagram
     if diagram:
-        mermaid = generate_mermaid_diagram(data, edge_list if edges else [])
+        mermaid = generate_mermaid_diagram(active_rows, edge_list if edges else [])
         diagram_path = output / "diagram.mmd"
-        with diagram_path.open("w") as f:
-            f.write(mermaid)
+        diagram_path.write_text(mermaid, encoding="utf-8")
         console.print(f"[green]Wrote {diagram_path}[/green]")
 
     # Summary of gaps
     console.print("\n[bold]Gap Analysis:[/bold]")
 
+    # Collect all observability gaps in one pass over active hosts
+    not_ready: list[str] = []
+    unmanaged: list[tuple[str, list[str]]] = []
+    missing_exp: list[tuple[str, list[str]]] = []
+    for row in active_rows:
+        obs = row.obs
+        if not obs.get("ready"):
+            not_ready.append(row.canonical)
+        if um := obs.get("unmanaged_services"):
+            unmanaged.append((row.canonical, um))
+        if me := obs.get("missing_exporters"):
+            missing_exp.append((row.canonical, me))
+
     # Hosts without observability.ready
-    not_ready = [
-        h.get("canonical_name", n)
-        for n, h in data.get("hosts", {}).items()
-        if h.get("status") == "active" and not h.get("observability", {}).get("ready")
-    ]
     if not_ready:
         console.print(f"  [yellow]Hosts not observability-ready ({len(not_ready)}):[/yellow]")
         for name in not_ready[:10]:
@@ -297,28 +430,12 @@ def analyze(
             console.print(f"    ... and {len(not_ready) - 10} more")
 
     # Hosts with unmanaged services
-    unmanaged = []
-    for n, h in data.get("hosts", {}).items():
-        if h.get("status") != "active":
-            continue
-        um = h.get("observability", {}).get("unmanaged_services", [])
-        if um:
-            unmanaged.append((h.get("canonical_name", n), um))
-
     if unmanaged:
         console.print(f"  [yellow]Hosts with unmanaged services ({len(unmanaged)}):[/yellow]")
         for name, services in unmanaged[:10]:
             console.print(f"    - {name}: {', '.join(services)}")
 
     # Missing exporters
-    missing_exp = []
-    for n, h in data.get("hosts", {}).items():
-        if h.get("status") != "active":
-            continue
-        me = h.get("observability", {}).get("missing_exporters", [])
-        if me:
-            missing_exp.append((h.get("canonical_name", n), me))
-
     if missing_exp:
         console.print(f"  [yellow]Hosts with missing exporters ({len(missing_exp)}):[/yellow]")
         for name, exporters in missing_exp:
@@ -2,11 +2,16 @@
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 import click
 from rich.console import Console
 from rich.table import Table
 
-from infralink.cli.main import Context, pass_context
+from infralink.cli.main import PLAIN_ROWS_THRESHOLD, Context, pass_context, print_plain_rows
+
+if TYPE_CHECKING:
+    from infralink.health.checks import HealthCheckResult
 
 console = Console()
 
@@ -80,7 +85,11 @@ def check(
     """
     from infralink.core.resolver import EdgeResolver
     from infralink.core.schema import Criticality, EdgeType
-    from infralink.health.checks import check_edge_health
+    from infralink.health.checks import (
+        check_all_edges,
+        results_to_json,
+        summarize_latencies,
+    )
 
     try:
         registry = ctx.registry
@@ -116,20 +125,54 @@ def check(
         console.print("[yellow]No edges match filter criteria[/yellow]")
         return
 
-    # Run health checks
-    results = []
-    for edge in edges_to_check:
-        result = check_edge_health(edge, resolver, timeout=timeout)
-        results.append(result)
+    # Run health checks concurrently, in edge order
+    results = check_all_edges(
+        resolver, timeout=timeout, critical_only=critical_only, edges=edges_to_check
+    )
 
     # Output results
     if output_json:
-        import json
-
-        console.print(json.dumps([r.to_dict() for r in results], indent=2))
+        click.echo(results_to_json(results))
         return
 
-    # Table output
+    healthy_count = sum(1 for r in results if r.healthy)
+    failed_count = len(results) - healthy_count
+
+    if len(results) > PLAIN_ROWS_THRESHOLD:
+        print_plain_rows(
+            (
+                r.edge_id,
+                r.edge_type,
+                r.target_endpoint,
+                "healthy" if r.healthy else "unhealthy",
+                f"{r.latency_ms:.1f}ms" if r.latency_ms else "-",
+                r.message or "",
+            )
+            for r in results
+        )
+    else:
+        _print_results_table(results)
+
+    # Summary
+    console.print(f"\n[bold]Summary:[/bold] {healthy_count} healthy, {failed_count} failed")
+    latency = summarize_latencies(results)
+    if latency:
+        p50, p95, mean = latency
+        console.print(f"[bold]Latency:[/bold] p50 {p50:.1f}ms, p95 {p95:.1f}ms, mean {mean:.1f}ms")
+
+    if failed_count > 0:
+        # Check for critical failures
+        critical_failures = [r for r in results if not r.healthy and r.criticality == "critical"]
+        if critical_failures:
+            console.print(
+                f"[red bold]CRITICAL:[/red bold] {len(critical_failures)} critical edge(s) unhealthy"
+            )
+            raise SystemExit(2)
+        raise SystemExit(1)
+
+
+def _print_results_table(results: list[HealthCheckResult]) -> None:
+    """Render health check results as a Rich table."""
     table = Table(title="Edge Health Check Results")
     table.add_column("Edge ID", style="cyan")
     table.add_column("Type")
@@ -138,16 +181,11 @@ def check(
     table.add_column("Latency")
     table.add_column("Message")
 
-    healthy_count = 0
-    failed_count = 0
-
     for result in results:
         if result.healthy:
             status = "[green]✓ healthy[/green]"
-            healthy_count += 1
         else:
             status = "[red]✗ unhealthy[/red]"
-            failed_count += 1
 
         latency = f"{result.latency_ms:.1f}ms" if result.latency_ms else "-"
 
@@ -161,16 +199,3 @@ def check(
         )
 
     console.print(table)
-
-    # Summary
-    console.print(f"\n[bold]Summary:[/bold] {healthy_count} healthy, {failed_count} failed")
-
-    if failed_count > 0:
-        # Check for critical failures
-        critical_failures = [r for r in results if not r.healthy and r.criticality == "critical"]
-        if critical_failures:
-            console.print(
-                f"[red bold]CRITICAL:[/red bold] {len(critical_failures)} critical edge(s) unhealthy"
-            )
-            raise SystemExit(2)
-        raise SystemExit(1)
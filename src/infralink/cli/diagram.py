@@ -3,12 +3,18 @@
 from __future__ import annotations
 
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import click
 from rich.console import Console
 
 from infralink.cli.main import Context, pass_context
 
+if TYPE_CHECKING:
+    from collections.abc import Collection
+
+    from infralink.core.registry import Host
+
 console = Console()
 
 
@@ -80,11 +86,12 @@ def diagram(
         console.print(f"[red]Error:[/red] {e}")
         raise SystemExit(1)
 
-    # Filter hosts
+    # Filter hosts once; every generator below re-iterates the same collection
+    hosts: Collection[Host]
     if filter_group:
-        hosts = [h for h in registry if h.group == filter_group]
+        hosts = registry.filter(group=filter_group)
     elif include_terminated:
-        hosts = list(registry)
+        hosts = registry
     else:
         hosts = registry.active_hosts()
 
@@ -2,15 +2,79 @@
 
 from __future__ import annotations
 
+import os
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import click
 from rich.console import Console
 
 from infralink.cli.main import Context, pass_context
 
+if TYPE_CHECKING:
+    from infralink.core.edges import EdgeSet
+    from infralink.core.registry import Host, Registry
+
 console = Console()
 
+# Shared state for host doc worker processes, set once per worker
+_worker_state: tuple[EdgeSet, Registry, Path, str | None] | None = None
+
+
+def _init_doc_worker(
+    edges: EdgeSet, registry: Registry, output: Path, generated_at: str | None
+) -> None:
+    global _worker_state
+    _worker_state = (edges, registry, output, generated_at)
+
+
+def _write_host_doc(
+    host: Host,
+    edges: EdgeSet,
+    registry: Registry,
+    output: Path,
+    generated_at: str | None = None,
+) -> Path:
+    """Render and write the Markdown doc for a single host."""
+    from infralink.generators.markdown import write_host_doc
+
+    doc_file = output / f"{host.canonical_name}.md"
+    with doc_file.open("w") as out:
+        write_host_doc(out, host, edges, registry, generated_at)
+    return doc_file
+
+
+def _write_host_doc_in_worker(host: Host) -> Path:
+    assert _worker_state is not None
+    return _write_host_doc(host, *_worker_state)
+
+
+def write_host_docs(
+    hosts: list[Host],
+    edges: EdgeSet,
+    registry: Registry,
+    output: Path,
+    generated_at: str | None = None,
+) -> list[Path]:
+    """
+    Write one Markdown doc per host, in parallel when there is enough work.
+
+    Registry and edges are shipped to each worker process once; only hosts
+    are sent per task. Small host lists are rendered in-process.
+    """
+    workers = os.cpu_count() or 1
+    if len(hosts) < workers or workers == 1:
+        return [_write_host_doc(host, edges, registry, output, generated_at) for host in hosts]
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_doc_worker,
+        initargs=(edges, registry, output, generated_at),
+    ) as ex:
+        return list(ex.map(_write_host_doc_in_worker, hosts, chunksize=16))
+
 
 @click.command()
 @click.option(
@@ -63,11 +127,7 @@ def docs(
         # Generate only index
         infralink docs --index-only
     """
-    from infralink.generators.markdown import (
-        generate_host_doc,
-        generate_index,
-        generate_edge_index,
-    )
+    from infralink.generators.markdown import write_edge_index, write_index
 
     try:
         registry = ctx.registry
@@ -78,11 +138,13 @@ def docs(
 
     output.mkdir(parents=True, exist_ok=True)
     generated_count = 0
+    # One generation time for every file in this run
+    generated_at = datetime.now().isoformat()
 
     # Generate index
-    index_content = generate_index(registry, edges)
     index_file = output / "index.md"
-    index_file.write_text(index_content)
+    with index_file.open("w") as out:
+        write_index(out, registry, edges, generated_at)
     generated_count += 1
     console.print(f"[green]Generated:[/green] {index_file}")
 
@@ -99,10 +161,7 @@ def docs(
             raise SystemExit(1)
         hosts = [host]
 
-    for host in hosts:
-        doc_content = generate_host_doc(host, edges, registry)
-        doc_file = output / f"{host.canonical_name}.md"
-        doc_file.write_text(doc_content)
+    for doc_file in write_host_docs(hosts, edges, registry, output, generated_at):
         generated_count += 1
 
         if ctx.verbose:
@@ -112,9 +171,9 @@ def docs(
     if len(edges) > 0:
         edge_dir = output.parent / "edges"
         edge_dir.mkdir(parents=True, exist_ok=True)
-        edge_index = generate_edge_index(edges, registry)
         edge_file = edge_dir / "index.md"
-        edge_file.write_text(edge_index)
+        with edge_file.open("w") as out:
+            write_edge_index(out, edges, registry, generated_at)
         generated_count += 1
         console.print(f"[green]Generated:[/green] {edge_file}")
 
@@ -2,13 +2,15 @@
 
 from __future__ import annotations
 
+import importlib
+from collections.abc import Iterable
 from pathlib import Path
 from typing import Any
 
 import click
 from rich.console import Console
 
-from infralink import __version__
+from infralink import _Loader, __version__
 
 console = Console()
 
@@ -16,6 +18,24 @@ console = Console()
 DEFAULT_REGISTRY = "examples/registry.yml"
 DEFAULT_EDGES = "examples/edges.yml"
 
+# Above this many rows, listings are printed as plain tab-separated lines as they
+# are produced instead of building a Rich table holding every styled cell
+PLAIN_ROWS_THRESHOLD = 500
+
+
+def _parse_registry(path: Path) -> dict[str, Any]:
+    """Parse a registry file."""
+    import yaml
+
+    data: dict[str, Any] = yaml.load(path.read_bytes(), Loader=_Loader)
+    return data
+
+
+def print_plain_rows(rows: Iterable[tuple[str, ...]]) -> None:
+    """Print rows as tab-separated lines without markup processing."""
+    for row in rows:
+        console.out("\t".join(row), highlight=False)
+
 
 class Context:
     """CLI context object passed to commands."""
@@ -26,6 +46,25 @@ class Context:
         self.verbose: bool = False
         self._registry: Any = None
         self._edges: Any = None
+        self._raw_data: dict[str, Any] | None = None
+
+    def _load_raw(self) -> dict[str, Any]:
+        """Parse the registry file once; shared by the registry and edges fallback."""
+        if self._raw_data is None:
+            assert self.registry_path is not None
+            self._raw_data = _parse_registry(self.registry_path)
+        return self._raw_data
+
+    def load_raw(self, path: Path | None = None) -> dict[str, Any]:
+        """
+        Return parsed registry YAML without validating it.
+
+        The context's own registry file is parsed once and shared; any other
+        ``path`` is parsed on each call and leaves the context untouched.
+        """
+        if path is None or path == self.registry_path:
+            return self._load_raw()
+        return _parse_registry(path)
 
     @property
     def registry(self) -> Any:
@@ -34,7 +73,7 @@ class Context:
             from infralink.core.registry import Registry
 
             if self.registry_path and self.registry_path.exists():
-                self._registry = Registry.load(self.registry_path)
+                self._registry = Registry.from_raw(self._load_raw())
             else:
                 raise click.ClickException(f"Registry not found: {self.registry_path}")
         return self._registry
@@ -49,12 +88,8 @@ class Context:
                 self._edges = EdgeSet.load(self.edges_path)
             else:
                 # Try loading from registry
-                import yaml
-
                 if self.registry_path and self.registry_path.exists():
-                    with self.registry_path.open() as f:
-                        data = yaml.safe_load(f)
-                    self._edges = EdgeSet.from_registry(data)
+                    self._edges = EdgeSet.from_registry(self._load_raw())
                 else:
                     self._edges = EdgeSet([])
         return self._edges
@@ -62,8 +97,39 @@ class Context:
 
 pass_context = click.make_pass_decorator(Context, ensure=True)
 
+# Subcommands living in their own modules: command name -> module path.
+# The command object has the same name as the command.
+LAZY_SUBCOMMANDS = {
+    "analyze": "infralink.cli.analyze",
+    "check": "infralink.cli.check",
+    "diagram": "infralink.cli.diagram",
+    "docs": "infralink.cli.docs",
+    "resolve": "infralink.cli.resolve",
+    "validate": "infralink.cli.validate",
+}
+
+
+class LazyGroup(click.Group):
+    """Click group that imports subcommand modules only when they are looked up."""
+
+    def __init__(
+        self, *args: Any, lazy_subcommands: dict[str, str] | None = None, **kwargs: Any
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands = lazy_subcommands or {}
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        return sorted([*super().list_commands(ctx), *self.lazy_subcommands])
 
-@click.group()
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        if cmd_name in self.lazy_subcommands:
+            module = importlib.import_module(self.lazy_subcommands[cmd_name])
+            command: click.Command = getattr(module, cmd_name)
+            return command
+        return super().get_command(ctx, cmd_name)
+
+
+@click.group(cls=LazyGroup, lazy_subcommands=LAZY_SUBCOMMANDS)
 @click.version_option(version=__version__, prog_name="infralink")
 @click.option(
     "-r",
@@ -93,22 +159,6 @@ def cli(ctx: Context, registry: Path, edges: Path, verbose: bool) -> None:
     ctx.verbose = verbose
 
 
-# Import and register subcommands
-from infralink.cli.analyze import analyze
-from infralink.cli.check import check
-from infralink.cli.diagram import diagram
-from infralink.cli.docs import docs
-from infralink.cli.resolve import resolve
-from infralink.cli.validate import validate
-
-cli.add_command(analyze)
-cli.add_command(check)
-cli.add_command(diagram)
-cli.add_command(docs)
-cli.add_command(resolve)
-cli.add_command(validate)
-
-
 @cli.command()
 @pass_context
 def info(ctx: Context) -> None:
@@ -166,6 +216,20 @@ def hosts(ctx: Context) -> None:
         console.print(f"[red]Error:[/red] {e}")
         return
 
+    if len(registry) > PLAIN_ROWS_THRESHOLD:
+        print_plain_rows(
+            (
+                host.canonical_name,
+                host.uuid_prefix + "...",
+                host.status.value,
+                host.group or "-",
+                host.cloud or "-",
+                host.tailscale_ip or "-",
+            )
+            for host in sorted(registry, key=lambda h: h.canonical_name)
+        )
+        return
+
     table = Table(title="Infrastructure Hosts")
     table.add_column("Name", style="cyan")
     table.add_column("UUID", style="dim")
@@ -204,6 +268,20 @@ def edges_list(ctx: Context) -> None:
         console.print("[yellow]No edges declared[/yellow]")
         return
 
+    if len(edges) > PLAIN_ROWS_THRESHOLD:
+        print_plain_rows(
+            (
+                edge.id,
+                edge.type.value,
+                edge.target_service,
+                str(edge.target_port),
+                edge.criticality.value,
+                "*" if edge.is_wildcard_source() else str(edge.source_host_count),
+            )
+            for edge in edges
+        )
+        return
+
     table = Table(title="Infrastructure Edges")
     table.add_column("ID", style="cyan")
     table.add_column("Type")
@@ -214,7 +292,7 @@ def edges_list(ctx: Context) -> None:
 
     for edge in edges:
         crit_style = "red" if edge.is_critical else "yellow" if edge.criticality.value == "high" else "dim"
-        sources = len(edge.source_hosts) if not edge.is_wildcard_source() else "*"
+        sources = edge.source_host_count if not edge.is_wildcard_source() else "*"
         table.add_row(
             edge.id,
             edge.type.value,
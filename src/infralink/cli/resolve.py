@@ -3,11 +3,8 @@
 from __future__ import annotations
 
 import click
-from rich.console import Console
 
-from infralink.cli.main import Context, pass_context
-
-console = Console()
+from infralink.cli.main import Context, console, pass_context
 
 
 @click.command()
@@ -99,12 +96,16 @@ def resolve(
     try:
         edge = resolver.get_edge(edge_id)
         target_host = resolver.get_target_host(edge_id)
+        # Resolve the address once for the formats that print it
+        ip = None
+        if output_format in ("ip", "endpoint", "env"):
+            ip = resolver.get_target_ip(edge_id, prefer_ip)
 
         if output_format == "ip":
-            console.print(resolver.get_target_ip(edge_id, prefer_ip))
+            console.print(ip)
 
         elif output_format == "endpoint":
-            console.print(resolver.get_target_endpoint(edge_id, prefer_ip))
+            console.print(f"{ip}:{edge.target_port}")
 
         elif output_format == "url":
             url = resolver.get_url(
@@ -137,15 +138,17 @@ def resolve(
 
         elif output_format == "env":
             prefix = edge_id.upper().replace("-", "_")
-            ip = resolver.get_target_ip(edge_id, prefer_ip)
             port = edge.target_port
-            console.print(f"export {prefix}_HOST={ip}")
-            console.print(f"export {prefix}_PORT={port}")
-            console.print(f"export {prefix}_ENDPOINT={ip}:{port}")
+            lines = [
+                f"export {prefix}_HOST={ip}",
+                f"export {prefix}_PORT={port}",
+                f"export {prefix}_ENDPOINT={ip}:{port}",
+            ]
             if user:
-                console.print(f"export {prefix}_USER={user}")
+                lines.append(f"export {prefix}_USER={user}")
             if database:
-                console.print(f"export {prefix}_DATABASE={database}")
+                lines.append(f"export {prefix}_DATABASE={database}")
+            console.print("\n".join(lines))
 
     except ResolutionError as e:
         console.print(f"[red]Resolution error:[/red] {e}")
@@ -2,12 +2,11 @@
 
 from __future__ import annotations
 
-import click
-from rich.console import Console
+from collections import Counter
 
-from infralink.cli.main import Context, pass_context
+import click
 
-console = Console()
+from infralink.cli.main import Context, console, pass_context
 
 
 @click.command()
@@ -43,8 +42,10 @@ def validate(ctx: Context, strict: bool, check_resolution: bool) -> None:
 
     # Load and validate registry
     console.print("[bold]Validating registry...[/bold]")
+    registry_ok = False
     try:
         registry = ctx.registry
+        registry_ok = True
         console.print(f"  [green]✓[/green] Registry loaded: {len(registry)} hosts")
     except Exception as e:
         errors.append(f"Registry validation failed: {e}")
@@ -52,55 +53,59 @@ def validate(ctx: Context, strict: bool, check_resolution: bool) -> None:
 
     # Load and validate edges
     console.print("[bold]Validating edges...[/bold]")
+    edges_ok = False
     try:
         edges = ctx.edges
+        edges_ok = True
         console.print(f"  [green]✓[/green] Edges loaded: {len(edges)} edges")
     except Exception as e:
         errors.append(f"Edge validation failed: {e}")
         console.print(f"  [red]✗[/red] Edge validation failed: {e}")
 
     # Check edge target references
-    if "registry" in dir() and "edges" in dir() and len(edges) > 0:
-        console.print("[bold]Checking edge references...[/bold]")
+    if registry_ok and edges_ok:
+        if len(edges) > 0:
+            console.print("[bold]Checking edge references...[/bold]")
+        get_host = registry.get_by_uuid
         for edge in edges:
+            edge_id, target_uuid, source_uuids = edge.id, edge.target_host, edge.source_hosts
+
             # Check target host exists
-            target = registry.get_by_uuid(edge.target_host)
+            target = get_host(target_uuid)
             if not target:
-                errors.append(f"Edge '{edge.id}': target host not found: {edge.target_host}")
-                console.print(f"  [red]✗[/red] Edge '{edge.id}': target host not found")
+                errors.append(f"Edge '{edge_id}': target host not found: {target_uuid}")
+                console.print(f"  [red]✗[/red] Edge '{edge_id}': target host not found")
             elif not target.is_active:
-                warnings.append(f"Edge '{edge.id}': target host is not active: {target.canonical_name}")
-                console.print(f"  [yellow]![/yellow] Edge '{edge.id}': target host not active")
+                warnings.append(f"Edge '{edge_id}': target host is not active: {target.canonical_name}")
+                console.print(f"  [yellow]![/yellow] Edge '{edge_id}': target host not active")
 
             # Check source hosts exist
-            for source_uuid in edge.source_hosts:
-                source = registry.get_by_uuid(source_uuid)
-                if not source:
-                    errors.append(f"Edge '{edge.id}': source host not found: {source_uuid}")
-                    console.print(f"  [red]✗[/red] Edge '{edge.id}': source not found: {source_uuid[:8]}...")
+            for source_uuid in source_uuids:
+                if not get_host(source_uuid):
+                    errors.append(f"Edge '{edge_id}': source host not found: {source_uuid}")
+                    console.print(f"  [red]✗[/red] Edge '{edge_id}': source not found: {source_uuid[:8]}...")
 
-        if not errors:
+        if len(edges) > 0 and not errors:
             console.print(f"  [green]✓[/green] All edge references valid")
 
-    # Check edge resolution
-    if check_resolution and "registry" in dir() and "edges" in dir():
-        console.print("[bold]Checking edge resolution...[/bold]")
-        resolver = EdgeResolver(registry, edges)
-        resolution_errors = resolver.validate_all()
-        if resolution_errors:
-            for err in resolution_errors:
-                errors.append(err)
-                console.print(f"  [red]✗[/red] {err}")
-        else:
-            console.print(f"  [green]✓[/green] All edges resolvable")
+        # Check edge resolution
+        if check_resolution:
+            console.print("[bold]Checking edge resolution...[/bold]")
+            resolver = EdgeResolver(registry, edges)
+            resolution_errors = resolver.validate_all()
+            if resolution_errors:
+                for err in resolution_errors:
+                    errors.append(err)
+                    console.print(f"  [red]✗[/red] {err}")
+            else:
+                console.print(f"  [green]✓[/green] All edges resolvable")
 
     # Check for duplicate edge IDs
-    if "edges" in dir():
-        seen_ids: set[str] = set()
-        for edge in edges:
-            if edge.id in seen_ids:
-                errors.append(f"Duplicate edge ID: {edge.id}")
-            seen_ids.add(edge.id)
+    if edges_ok:
+        id_counts = Counter(edge.id for edge in edges)
+        for edge_id, count in id_counts.items():
+            if count > 1:
+                errors.append(f"Duplicate edge ID: {edge_id} (declared {count} times)")
 
     # Summary
     console.print("\n[bold]Validation Summary[/bold]")
@@ -1,9 +1,25 @@
 """Core domain models for infrastructure topology."""
 
-from infralink.core.registry import Registry, Host
-from infralink.core.edges import EdgeSet, Edge, EdgeType
-from infralink.core.resolver import EdgeResolver
-from infralink.core.schema import RegistrySchema, EdgeSchema
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from infralink.core.edges import Edge, EdgeSet, EdgeType
+    from infralink.core.registry import Host, Registry
+    from infralink.core.resolver import EdgeResolver
+    from infralink.core.schema import EdgeSchema, RegistrySchema
+
+# Public names -> defining module, imported on first access
+_LAZY_IMPORTS = {
+    "Registry": "infralink.core.registry",
+    "Host": "infralink.core.registry",
+    "EdgeSet": "infralink.core.edges",
+    "Edge": "infralink.core.edges",
+    "EdgeType": "infralink.core.edges",
+    "EdgeResolver": "infralink.core.resolver",
+    "RegistrySchema": "infralink.core.schema",
+    "EdgeSchema": "infralink.core.schema",
+}
 
 __all__ = [
     "Registry",
@@ -15,3 +31,12 @@ __all__ = [
     "RegistrySchema",
     "EdgeSchema",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_path = _LAZY_IMPORTS.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_path), name)
+    globals()[name] = value
+    return value
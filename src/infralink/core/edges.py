@@ -2,11 +2,16 @@
 
 from __future__ import annotations
 
+import functools
+import heapq
+import sys
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Iterator
 
 import yaml
 
+from infralink import _Loader
 from infralink.core.schema import (
     Criticality,
     EdgeSchema,
@@ -16,31 +21,76 @@ from infralink.core.schema import (
 )
 
 
+@dataclass(slots=True, frozen=True)
+class _EdgeView:
+    """Flat copy of the edge fields read on hot paths."""
+
+    id: str
+    type: EdgeType
+    target_host: str
+    target_service: str
+    target_port: int
+    protocol: str | None
+    criticality: Criticality
+    is_critical: bool
+
+
 class Edge:
     """Represents a connection between infrastructure nodes."""
 
-    def __init__(self, data: dict[str, Any]) -> None:
-        self._data = data
-        # Handle 'from' -> 'from_' alias
-        if "from" in data and "from_" not in data:
-            data["from_"] = data.pop("from")
-        self._schema = EdgeSchema(**data)
+    __slots__ = (
+        "_schema",
+        "_is_wildcard",
+        "_source_hosts",
+        "_source_hosts_set",
+        "_view",
+    )
+
+    def __init__(
+        self, data: dict[str, Any] | None = None, *, schema: EdgeSchema | None = None
+    ) -> None:
+        if schema is None:
+            if data is None:
+                raise TypeError("Edge requires data or schema")
+            schema = EdgeSchema.model_validate(data)
+        self._schema = schema
+        hosts = self._schema.from_.hosts
+        self._is_wildcard = hosts == "*"
+        # Wildcard sources must be resolved against the registry, so they list no hosts
+        # Host UUIDs and service names recur across edges; share one string each
+        intern = sys.intern
+        self._source_hosts: tuple[str, ...] = (
+            tuple(map(intern, hosts)) if isinstance(hosts, list) else ()
+        )
+        self._source_hosts_set = frozenset(self._source_hosts)
+        self._view = _EdgeView(
+            id=schema.id,
+            type=schema.type,
+            target_host=intern(schema.to.host),
+            target_service=intern(schema.to.service),
+            target_port=schema.to.port,
+            protocol=intern(schema.protocol) if schema.protocol is not None else None,
+            criticality=schema.metadata.criticality,
+            is_critical=schema.metadata.criticality == Criticality.CRITICAL,
+        )
 
     @property
     def id(self) -> str:
-        return self._schema.id
+        return self._view.id
 
     @property
     def type(self) -> EdgeType:
-        return self._schema.type
+        return self._view.type
 
     @property
     def source_hosts(self) -> list[str]:
         """Get source host UUIDs."""
-        hosts = self._schema.from_.hosts
-        if hosts == "*":
-            return []  # Wildcard - must be resolved against registry
-        return list(hosts) if isinstance(hosts, list) else []
+        return list(self._source_hosts)
+
+    @property
+    def source_host_count(self) -> int:
+        """Number of explicit source hosts; 0 for wildcard sources."""
+        return len(self._source_hosts)
 
     @property
     def source_selector(self) -> dict[str, Any] | None:
@@ -54,27 +104,27 @@ class Edge:
     @property
     def target_host(self) -> str:
         """Target host UUID."""
-        return self._schema.to.host
+        return self._view.target_host
 
     @property
     def target_service(self) -> str:
-        return self._schema.to.service
+        return self._view.target_service
 
     @property
     def target_port(self) -> int:
-        return self._schema.to.port
+        return self._view.target_port
 
     @property
     def protocol(self) -> str | None:
-        return self._schema.protocol
+        return self._view.protocol
 
     @property
     def criticality(self) -> Criticality:
-        return self._schema.metadata.criticality
+        return self._view.criticality
 
     @property
     def is_critical(self) -> bool:
-        return self._schema.metadata.criticality == Criticality.CRITICAL
+        return self._view.is_critical
 
     @property
     def purpose(self) -> str | None:
@@ -94,21 +144,20 @@ class Edge:
 
     def is_wildcard_source(self) -> bool:
         """Check if source is wildcard (all hosts)."""
-        return self._schema.from_.hosts == "*"
+        return self._is_wildcard
 
     def matches_source(self, host_uuid: str) -> bool:
         """Check if a host UUID is a source for this edge."""
-        if self.is_wildcard_source():
-            return True
-        return host_uuid in self.source_hosts
+        return self._is_wildcard or host_uuid in self._source_hosts_set
 
     def to_dict(self) -> dict[str, Any]:
-        return self._data.copy()
+        # Plain values in the file format's shape ("from" key, declared fields only)
+        return self._schema.model_dump(mode="json", by_alias=True, exclude_unset=True)
 
     def __repr__(self) -> str:
         return (
             f"Edge({self.id}, {self.type.value}: "
-            f"{len(self.source_hosts)} sources -> {self.target_service}:{self.target_port})"
+            f"{len(self._source_hosts)} sources -> {self.target_service}:{self.target_port})"
         )
 
 
@@ -119,27 +168,41 @@ class EdgeSet:
     Manages edge definitions and provides query capabilities.
     """
 
+    # Edge attributes indexed at construction; queries on others are scanned once per value.
+    # Each is also a field of the edge's flat view, which the index build reads directly.
+    _INDEXED_ATTRS = ("type", "criticality", "target_host", "target_service")
+
     def __init__(self, edges: list[Edge], schema_version: str = "1.0") -> None:
         self._edges = edges
         self._schema_version = schema_version
         self._id_index: dict[str, Edge] = {e.id: e for e in edges}
-        self._type_index: dict[EdgeType, list[Edge]] = {}
-        for edge in edges:
-            self._type_index.setdefault(edge.type, []).append(edge)
+        # Attribute -> value -> edges, in declaration order
+        self._indexes: dict[str, dict[Any, list[Edge]]] = {a: {} for a in self._INDEXED_ATTRS}
+        self._query_cache: dict[tuple[str, Any], list[Edge]] = {}
+        # Explicit sources are indexed per host; wildcard edges match every host
+        self._source_host_index: dict[str, list[Edge]] = {}
+        self._wildcard_source_edges: list[Edge] = []
+        # Declaration order, used to merge explicit and wildcard matches
+        self._position: dict[Edge, int] = {}
+        for i, edge in enumerate(edges):
+            self._position[edge] = i
+            view = edge._view
+            for attr, index in self._indexes.items():
+                index.setdefault(getattr(view, attr), []).append(edge)
+            if edge.is_wildcard_source():
+                self._wildcard_source_edges.append(edge)
+            else:
+                for source in edge._source_hosts_set:
+                    self._source_host_index.setdefault(source, []).append(edge)
 
     @classmethod
     def load(cls, path: str | Path) -> EdgeSet:
-        """Load edges from YAML file."""
-        path = Path(path)
-        with path.open() as f:
-            data = yaml.safe_load(f)
-
-        # Validate with schema
-        schema = EdgeSetSchema(**data)
-
-        edges = [Edge(e.model_dump(by_alias=True)) for e in schema.edges]
+        """
+        Load edges from YAML file.
 
-        return cls(edges, schema.schema_version)
+        Repeated loads of unchanged content return the same edge set.
+        """
+        return _load_edges(cls, Path(path).read_bytes())
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> EdgeSet:
@@ -160,13 +223,25 @@ class EdgeSet:
         """Get edge by ID."""
         return self._id_index.get(edge_id)
 
+    def _filtered(self, attr: str, value: Any) -> list[Edge]:
+        """Edges whose ``attr`` equals ``value``, in declaration order; cached per argument."""
+        index = self._indexes.get(attr)
+        if index is not None:
+            return index.get(value, [])
+        key = (attr, value)
+        result = self._query_cache.get(key)
+        if result is None:
+            result = [e for e in self._edges if getattr(e, attr) == value]
+            self._query_cache[key] = result
+        return result
+
     def by_type(self, edge_type: EdgeType) -> list[Edge]:
         """Get all edges of a specific type."""
-        return self._type_index.get(edge_type, [])
+        return list(self._filtered("type", edge_type))
 
     def by_criticality(self, criticality: Criticality) -> list[Edge]:
         """Get all edges with specific criticality."""
-        return [e for e in self._edges if e.criticality == criticality]
+        return list(self._filtered("criticality", criticality))
 
     def critical_edges(self) -> list[Edge]:
         """Get all critical edges."""
@@ -174,15 +249,25 @@ class EdgeSet:
 
     def targeting_host(self, host_uuid: str) -> list[Edge]:
         """Get all edges targeting a specific host."""
-        return [e for e in self._edges if e.target_host == host_uuid]
+        return list(self._filtered("target_host", host_uuid))
 
     def from_host(self, host_uuid: str) -> list[Edge]:
         """Get all edges originating from a specific host."""
-        return [e for e in self._edges if e.matches_source(host_uuid)]
+        explicit = self._source_host_index.get(host_uuid, [])
+        wildcard = self._wildcard_source_edges
+        if not wildcard or not explicit:
+            return list(explicit or wildcard)
+        # Interleaving both lists back into declaration order is done once per host
+        key = ("from_host", host_uuid)
+        merged = self._query_cache.get(key)
+        if merged is None:
+            merged = list(heapq.merge(explicit, wildcard, key=self._position.__getitem__))
+            self._query_cache[key] = merged
+        return list(merged)
 
     def targeting_service(self, service: str) -> list[Edge]:
         """Get all edges targeting a specific service."""
-        return [e for e in self._edges if e.target_service == service]
+        return list(self._filtered("target_service", service))
 
     def database_edges(self) -> list[Edge]:
         """Get all database-type edges."""
@@ -208,3 +293,17 @@ class EdgeSet:
 
     def __contains__(self, edge_id: str) -> bool:
         return edge_id in self._id_index
+
+
+@functools.lru_cache(maxsize=8)
+def _load_edges(cls: type[EdgeSet], content: bytes) -> EdgeSet:
+    """Parse edges file content; cached on the content itself."""
+    # Hand libyaml the raw bytes; it detects the encoding itself
+    data = yaml.load(content, Loader=_Loader)
+
+    # Validate with schema
+    schema = EdgeSetSchema.model_validate(data)
+
+    edges = [Edge(schema=e) for e in schema.edges]
+
+    return cls(edges, schema.schema_version)
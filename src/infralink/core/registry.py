@@ -2,12 +2,36 @@
 
 from __future__ import annotations
 
+import bisect
+import functools
+import operator
+import sys
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Iterator
 
 import yaml
 
-from infralink.core.schema import HostSchema, HostStatus, RegistrySchema
+from infralink import _Loader
+from infralink.core.schema import (
+    HostSchema,
+    HostStatus,
+    RegistrySchema,
+    service_config_dict,
+)
+
+
+@dataclass(slots=True, frozen=True)
+class _HostView:
+    """Flat copy of the host fields read on hot paths."""
+
+    canonical_name: str
+    status: HostStatus
+    group: str | None
+    cloud: str | None
+    tailscale_ip: str | None
+    public_ip: str | None
+    role_set: frozenset[str]
 
 
 class Host:
@@ -18,17 +42,46 @@ class Host:
     from the host data since it's the dictionary key in the registry.
     """
 
-    def __init__(self, uuid: str, data: dict[str, Any]) -> None:
+    __slots__ = ("_uuid", "_schema", "_view", "_ip_by_pref")
+
+    def __init__(
+        self,
+        uuid: str,
+        data: dict[str, Any] | None = None,
+        *,
+        schema: HostSchema | None = None,
+    ) -> None:
         """
         Initialize a host.
 
         Args:
             uuid: The host's UUID (primary key from registry)
             data: Host configuration data (without uuid field)
+            schema: Already-validated host data; skips validation when given
         """
-        self._uuid = uuid
-        self._data = data
-        self._schema = HostSchema(**data)
+        if schema is None:
+            if data is None:
+                raise TypeError("Host requires data or schema")
+            schema = HostSchema.model_validate(data)
+        # UUIDs, groups and clouds recur across hosts and edges; share one string each
+        self._uuid = sys.intern(uuid)
+        self._schema = schema
+        self._view = _HostView(
+            canonical_name=schema.canonical_name,
+            status=schema.status,
+            group=sys.intern(schema.group) if schema.group is not None else None,
+            cloud=sys.intern(schema.cloud) if schema.cloud is not None else None,
+            tailscale_ip=schema.tailscale_ip,
+            public_ip=schema.public_ip,
+            role_set=frozenset(schema.roles),
+        )
+        # Address for each preferred network, falling back to the others
+        ts, pub, priv = schema.tailscale_ip, schema.public_ip, schema.private_ip
+        self._ip_by_pref: dict[str, str | None] = {
+            "tailscale": ts or pub or priv,
+            "public": pub or ts or priv,
+            "private": priv or ts or pub,
+        }
 
     @property
     def uuid(self) -> str:
@@ -43,36 +96,42 @@ class Host:
     @property
     def canonical_name(self) -> str:
         """Human-readable name for the host."""
-        return self._schema.canonical_name
+        return self._view.canonical_name
 
     @property
     def status(self) -> HostStatus:
-        return self._schema.status
+        return self._view.status
 
     @property
     def is_active(self) -> bool:
-        return self._schema.status == HostStatus.ACTIVE
+        return self._view.status == HostStatus.ACTIVE
+
+    @property
+    def observability_ready(self) -> bool:
+        """Whether the host is declared fully observable."""
+        observability = self._schema.observability
+        return observability is not None and observability.ready
 
     @property
     def group(self) -> str | None:
-        return self._schema.group
+        return self._view.group
 
     @property
     def cloud(self) -> str | None:
-        return self._schema.cloud
+        return self._view.cloud
 
     @property
     def tailscale_ip(self) -> str | None:
-        return self._schema.tailscale_ip
+        return self._view.tailscale_ip
 
     @property
     def public_ip(self) -> str | None:
-        return self._schema.public_ip
+        return self._view.public_ip
 
     @property
     def services(self) -> dict[str, Any]:
         """Service configurations keyed by service name."""
-        return {name: cfg.model_dump() for name, cfg in self._schema.services.items()}
+        return {name: service_config_dict(cfg) for name, cfg in self._schema.services.items()}
 
     @property
     def service_names(self) -> list[str]:
@@ -82,13 +141,13 @@ class Host:
     def get_service(self, name: str) -> dict[str, Any] | None:
         """Get service config by name."""
         if name in self._schema.services:
-            return self._schema.services[name].model_dump()
+            return service_config_dict(self._schema.services[name])
         return None
 
     def get_service_port(self, name: str) -> int | None:
         """Get port for a service."""
         if name in self._schema.services:
-            return self._schema.services[name].port
+            return self._schema.services[name].get("port")
         return None
 
     @property
@@ -102,7 +161,7 @@ class Host:
         return self._schema.role_overrides
 
     def has_role(self, role: str) -> bool:
-        return role in self._schema.roles
+        return role in self._view.role_set
 
     @property
     def public_ip_secondary(self) -> str | None:
@@ -125,21 +184,20 @@ class Host:
         return self._schema.mounts
 
     def has_service(self, service: str) -> bool:
-        return service in self._schema.services.keys()
+        return service in self._schema.services
 
     def get_ip(self, prefer: str = "tailscale") -> str | None:
         """Get IP address with preference order."""
-        if prefer == "tailscale":
-            return self.tailscale_ip or self.public_ip or self._schema.private_ip
-        elif prefer == "public":
-            return self.public_ip or self.tailscale_ip or self._schema.private_ip
-        elif prefer == "private":
-            return self._schema.private_ip or self.tailscale_ip or self.public_ip
-        return self.tailscale_ip
+        try:
+            return self._ip_by_pref[prefer]
+        except KeyError:
+            # Unknown preferences get the tailscale address, without fallback
+            return self._view.tailscale_ip
 
     def to_dict(self) -> dict[str, Any]:
         """Return host data as dictionary (includes uuid)."""
-        result = self._data.copy()
+        # Plain values and only the keys the registry declared, so the dict dumps as YAML
+        result = self._schema.model_dump(mode="json", exclude_unset=True)
         result["uuid"] = self._uuid
         return result
 
@@ -147,6 +205,14 @@ class Host:
         return f"Host({self.canonical_name}, uuid={self.uuid_prefix}..., status={self.status.value})"
 
 
+# Registry.filter() criteria in argument order, as getters for the matching index.
+# Service and role indexes are cached properties, so they are only built when queried.
+_FILTER_INDEXES = tuple(
+    operator.attrgetter(name)
+    for name in ("_by_status", "_by_group", "_by_cloud", "_by_service", "_by_role")
+)
+
+
 class Registry:
     """
     Infrastructure host registry.
@@ -166,22 +232,90 @@ class Registry:
         self._hosts = hosts  # UUID -> Host
         self._defaults = defaults or {}
         # Secondary index: canonical_name -> Host
-        self._name_index: dict[str, Host] = {h.canonical_name: h for h in hosts.values()}
+        self._name_index: dict[str, Host] = {}
         # Secondary index: uuid_prefix -> Host
-        self._uuid_prefix_index: dict[str, Host] = {h.uuid_prefix: h for h in hosts.values()}
+        self._uuid_prefix_index: dict[str, Host] = {}
+        # Inverted indexes for filter(): attribute value -> {uuid: Host} in registry order.
+        # Service and role indexes, and the partial-prefix structures, are built on
+        # first use (see the cached properties below).
+        self._by_status: dict[HostStatus, dict[str, Host]] = {}
+        self._by_group: dict[str, dict[str, Host]] = {}
+        self._by_cloud: dict[str, dict[str, Host]] = {}
+        # The eager indexes are filled in a single pass over the hosts, reading the
+        # flat views directly rather than through the properties
+        for uuid, host in hosts.items():
+            view = host._view
+            self._name_index[view.canonical_name] = host
+            # Colliding 8-char prefixes go to the host declared first, as for other lengths
+            self._uuid_prefix_index.setdefault(uuid[:8], host)
+            self._by_status.setdefault(view.status, {})[uuid] = host
+            if view.group:
+                self._by_group.setdefault(view.group, {})[uuid] = host
+            if view.cloud:
+                self._by_cloud.setdefault(view.cloud, {})[uuid] = host
+        self._groups = frozenset(self._by_group)
+        self._clouds = frozenset(self._by_cloud)
+        self._active_hosts = tuple(self._by_status.get(HostStatus.ACTIVE, {}).values())
+        self._observability_ready = tuple(h for h in self._active_hosts if h.observability_ready)
+
+    @functools.cached_property
+    def _short_prefix_index(self) -> dict[str, Host]:
+        """Prefixes shorter than 4 chars (including "") -> first host in registry order."""
+        index: dict[str, Host] = {}
+        for uuid, host in self._hosts.items():
+            # Once a prefix is taken, all shorter ones are too
+            for length in range(3, -1, -1):
+                if uuid[:length] in index:
+                    break
+                index[uuid[:length]] = host
+        return index
+
+    @functools.cached_property
+    def _sorted_uuids(self) -> list[str]:
+        """
+        UUIDs in sorted order, bisected for longer partial prefixes.
+
+        Ties go to the host declared first (see _order), as with a scan in
+        registry order.
+        """
+        return sorted(self._hosts)
+
+    @functools.cached_property
+    def _order(self) -> dict[str, int]:
+        return {uuid: i for i, uuid in enumerate(self._hosts)}
+
+    @functools.cached_property
+    def _by_service(self) -> dict[str, dict[str, Host]]:
+        index: dict[str, dict[str, Host]] = {}
+        for uuid, host in self._hosts.items():
+            for service in host._schema.services:
+                index.setdefault(service, {})[uuid] = host
+        return index
+
+    @functools.cached_property
+    def _by_role(self) -> dict[str, dict[str, Host]]:
+        index: dict[str, dict[str, Host]] = {}
+        for uuid, host in self._hosts.items():
+            for role in host._schema.roles:
+                index.setdefault(role, {})[uuid] = host
+        return index
 
     @classmethod
     def load(cls, path: str | Path) -> Registry:
-        """Load registry from YAML file."""
-        path = Path(path)
-        with path.open() as f:
-            data = yaml.safe_load(f)
+        """
+        Load registry from YAML file.
+
+        Repeated loads of unchanged content return the same registry.
+        """
+        return _load_registry(cls, Path(path).read_bytes())
 
-        # Validate with schema
-        schema = RegistrySchema(**data)
+    @classmethod
+    def from_raw(cls, data: dict[str, Any]) -> Registry:
+        """Create registry from parsed registry YAML, validating it against the schema."""
+        schema = RegistrySchema.model_validate(data)
 
         # UUID is the key, data is the value
-        hosts = {uuid: Host(uuid, host.model_dump()) for uuid, host in schema.hosts.items()}
+        hosts = {sys.intern(uuid): Host(uuid, schema=host) for uuid, host in schema.hosts.items()}
 
         return cls(hosts, schema.ansible_defaults)
 
@@ -190,7 +324,7 @@ class Registry:
         """Create registry from dictionary."""
         hosts_data = data.get("hosts", {})
         # UUID is the key
-        hosts = {uuid: Host(uuid, h) for uuid, h in hosts_data.items()}
+        hosts = {sys.intern(uuid): Host(uuid, h) for uuid, h in hosts_data.items()}
         return cls(hosts, data.get("ansible_defaults"))
 
     def get_by_uuid(self, uuid: str) -> Host | None:
@@ -203,10 +337,16 @@ class Registry:
         if prefix in self._uuid_prefix_index:
             return self._uuid_prefix_index[prefix]
         # Try partial match
-        for full_uuid, host in self._hosts.items():
-            if full_uuid.startswith(prefix):
-                return host
-        return None
+        if len(prefix) < 4:
+            return self._short_prefix_index.get(prefix)
+        uuids = self._sorted_uuids
+        lo = bisect.bisect_left(uuids, prefix)
+        hi = lo
+        while hi < len(uuids) and uuids[hi].startswith(prefix):
+            hi += 1
+        if lo == hi:
+            return None
+        return self._hosts[min(uuids[lo:hi], key=self._order.__getitem__)]
 
     def get_by_name(self, name: str) -> Host | None:
         """Get host by canonical name."""
@@ -232,40 +372,45 @@ class Registry:
         role: str | None = None,
     ) -> list[Host]:
         """Filter hosts by criteria."""
-        results = []
-        for host in self._hosts.values():
-            if status and host.status != status:
-                continue
-            if group and host.group != group:
-                continue
-            if cloud and host.cloud != cloud:
-                continue
-            if service and not host.has_service(service):
-                continue
-            if role and not host.has_role(role):
-                continue
-            results.append(host)
-        return results
+        matches: list[dict[str, Host]] = []
+        for index_of, value in zip(_FILTER_INDEXES, (status, group, cloud, service, role)):
+            if value:
+                match = index_of(self).get(value)
+                if not match:
+                    return []
+                matches.append(match)
+        if not matches:
+            return list(self._hosts.values())
+        if len(matches) == 1:
+            return list(matches[0].values())
+        # Walk the smallest match set, checking membership in the others
+        matches.sort(key=len)
+        smallest, rest = matches[0], matches[1:]
+        return [host for uuid, host in smallest.items() if all(uuid in m for m in rest)]
 
     def active_hosts(self) -> list[Host]:
         """Get all active hosts."""
-        return self.filter(status=HostStatus.ACTIVE)
+        return list(self._active_hosts)
+
+    def observability_ready_hosts(self) -> list[Host]:
+        """Get all active hosts that are declared fully observable."""
+        return list(self._observability_ready)
 
     def hosts_with_role(self, role: str) -> list[Host]:
         """Get all hosts with a specific role."""
-        return [h for h in self._hosts.values() if h.has_role(role)]
+        return list(self._by_role.get(role, {}).values())
 
     def hosts_with_service(self, service: str) -> list[Host]:
         """Get all hosts running a specific service."""
-        return [h for h in self._hosts.values() if h.has_service(service)]
+        return list(self._by_service.get(service, {}).values())
 
-    def groups(self) -> set[str]:
+    def groups(self) -> frozenset[str]:
         """Get all unique groups."""
-        return {h.group for h in self._hosts.values() if h.group}
+        return self._groups
 
-    def clouds(self) -> set[str]:
+    def clouds(self) -> frozenset[str]:
         """Get all unique cloud providers."""
-        return {h.cloud for h in self._hosts.values() if h.cloud}
+        return self._clouds
 
     @property
     def defaults(self) -> dict[str, Any]:
@@ -277,5 +422,20 @@ class Registry:
     def __iter__(self) -> Iterator[Host]:
         return iter(self._hosts.values())
 
-    def __contains__(self, item: str) -> bool:
-        return self.get(item) is not None
+    def __contains__(self, item: object) -> bool:
+        """
+        Check for a host by UUID, UUID prefix, or canonical name, as get() resolves them.
+        """
+        if not isinstance(item, str):
+            return False
+        if item in self._hosts or item in self._uuid_prefix_index or item in self._name_index:
+            return True
+        return self.get_by_uuid_prefix(item) is not None
+
+
+@functools.lru_cache(maxsize=8)
+def _load_registry(cls: type[Registry], content: bytes) -> Registry:
+    """Parse registry file content; cached on the content itself."""
+    # Hand libyaml the raw bytes; it detects the encoding itself
+    data = yaml.load(content, Loader=_Loader)
+    return cls.from_raw(data)
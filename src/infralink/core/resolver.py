@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from dataclasses import dataclass
 from typing import Any
 from urllib.parse import quote_plus
 
@@ -9,12 +10,34 @@ from infralink.core.edges import Edge, EdgeSet
 from infralink.core.registry import Host, Registry
 
 
+# Characters quote_plus never escapes
+_URL_SAFE = frozenset("ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789_.-~")
+
+
+def _quote_plus(value: str) -> str:
+    """quote_plus, returning already-safe values (most passwords) without encoding."""
+    if _URL_SAFE.issuperset(value):
+        return value
+    return quote_plus(value)
+
+
 class ResolutionError(Exception):
     """Raised when edge resolution fails."""
 
     pass
 
 
+@dataclass(slots=True, frozen=True)
+class _ResolvedTarget:
+    """An edge's target resolved for one IP preference."""
+
+    edge: Edge
+    host: Host
+    ip: str
+    port: int
+    endpoint: str  # "ip:port", shared by every URL built for this target
+
+
 class EdgeResolver:
     """
     Resolves edge targets for template rendering.
@@ -26,6 +49,12 @@ class EdgeResolver:
     def __init__(self, registry: Registry, edges: EdgeSet) -> None:
         self._registry = registry
         self._edges = edges
+        # Resolved lookups per edge ID; registry and edges are not mutated after load
+        self._target_host_cache: dict[str, Host] = {}
+        self._resolved_cache: dict[tuple[str, str], _ResolvedTarget] = {}
+        self._context_cache: dict[tuple[str, str], dict[str, Any]] = {}
+        self._source_hosts_cache: dict[str, list[Host]] = {}
+        self._validation_errors: list[str] | None = None
 
     def get_edge(self, edge_id: str) -> Edge:
         """Get edge by ID, raising if not found."""
@@ -36,23 +65,39 @@ class EdgeResolver:
 
     def get_target_host(self, edge_id: str) -> Host:
         """Get the target host for an edge."""
+        host = self._target_host_cache.get(edge_id)
+        if host is not None:
+            return host
         edge = self.get_edge(edge_id)
         host = self._registry.get_by_uuid(edge.target_host)
         if not host:
             raise ResolutionError(
                 f"Target host not found for edge {edge_id}: {edge.target_host}"
             )
+        self._target_host_cache[edge_id] = host
         return host
 
-    def get_target_ip(self, edge_id: str, prefer: str = "tailscale") -> str:
-        """Get the target IP address for an edge."""
+    def _resolve(self, edge_id: str, prefer: str) -> _ResolvedTarget:
+        """Resolve an edge's target host, IP and port; cached per (edge, preference)."""
+        key = (edge_id, prefer)
+        target = self._resolved_cache.get(key)
+        if target is not None:
+            return target
+        edge = self.get_edge(edge_id)
         host = self.get_target_host(edge_id)
         ip = host.get_ip(prefer)
         if not ip:
             raise ResolutionError(
                 f"No IP address available for edge {edge_id} target: {host.canonical_name}"
             )
-        return ip
+        port = edge.target_port
+        target = _ResolvedTarget(edge, host, ip, port, f"{ip}:{port}")
+        self._resolved_cache[key] = target
+        return target
+
+    def get_target_ip(self, edge_id: str, prefer: str = "tailscale") -> str:
+        """Get the target IP address for an edge."""
+        return self._resolve(edge_id, prefer).ip
 
     def get_target_port(self, edge_id: str) -> int:
         """Get the target port for an edge."""
@@ -61,9 +106,7 @@ class EdgeResolver:
 
     def get_target_endpoint(self, edge_id: str, prefer: str = "tailscale") -> str:
         """Get target as 'ip:port' string."""
-        ip = self.get_target_ip(edge_id, prefer)
-        port = self.get_target_port(edge_id)
-        return f"{ip}:{port}"
+        return self._resolve(edge_id, prefer).endpoint
 
     def get_url(
         self,
@@ -86,22 +129,25 @@ class EdgeResolver:
             resolver.get_url("otel-to-collector")
             # Returns: otlp://100.91.20.46:4317
         """
-        edge = self.get_edge(edge_id)
-        ip = self.get_target_ip(edge_id, prefer_ip)
-        port = edge.target_port
-        protocol = edge.protocol or "tcp"
+        target = self._resolve(edge_id, prefer_ip)
+        endpoint = target.endpoint
+        protocol = target.edge.protocol or "tcp"
+
+        # Common database shape: credentials and a database, nothing else
+        if user and password and database and not path and not query_params:
+            return f"{protocol}://{user}:{_quote_plus(password)}@{endpoint}/{database}"
 
         # Build URL
         if user and password:
             # URL-encode password in case of special characters
-            encoded_password = quote_plus(password)
+            encoded_password = _quote_plus(password)
             auth = f"{user}:{encoded_password}@"
         elif user:
             auth = f"{user}@"
         else:
             auth = ""
 
-        url = f"{protocol}://{auth}{ip}:{port}"
+        url = f"{protocol}://{auth}{endpoint}"
 
         if database:
             url = f"{url}/{database}"
@@ -110,7 +156,7 @@ class EdgeResolver:
             url = f"{url}{path}"
 
         if query_params:
-            query_string = "&".join(f"{k}={quote_plus(v)}" for k, v in query_params.items())
+            query_string = "&".join(f"{k}={_quote_plus(v)}" for k, v in query_params.items())
             url = f"{url}?{query_string}"
 
         return url
@@ -124,12 +170,11 @@ class EdgeResolver:
         prefer_ip: str = "tailscale",
     ) -> str:
         """Build a Redis connection URL."""
-        ip = self.get_target_ip(edge_id, prefer_ip)
-        port = self.get_target_port(edge_id)
+        endpoint = self._resolve(edge_id, prefer_ip).endpoint
 
         if password:
-            return f"redis://:{quote_plus(password)}@{ip}:{port}/{db}"
-        return f"redis://{ip}:{port}/{db}"
+            return f"redis://:{_quote_plus(password)}@{endpoint}/{db}"
+        return f"redis://{endpoint}/{db}"
 
     def get_postgres_url(
         self,
@@ -142,10 +187,9 @@ class EdgeResolver:
         prefer_ip: str = "tailscale",
     ) -> str:
         """Build a PostgreSQL connection URL."""
-        ip = self.get_target_ip(edge_id, prefer_ip)
-        port = self.get_target_port(edge_id)
-        encoded_password = quote_plus(password)
-        return f"{driver}://{user}:{encoded_password}@{ip}:{port}/{database}"
+        endpoint = self._resolve(edge_id, prefer_ip).endpoint
+        encoded_password = _quote_plus(password)
+        return f"{driver}://{user}:{encoded_password}@{endpoint}/{database}"
 
     def get_mysql_url(
         self,
@@ -158,19 +202,25 @@ class EdgeResolver:
         prefer_ip: str = "tailscale",
     ) -> str:
         """Build a MySQL/MariaDB connection URL."""
-        ip = self.get_target_ip(edge_id, prefer_ip)
-        port = self.get_target_port(edge_id)
-        encoded_password = quote_plus(password)
-        return f"{driver}://{user}:{encoded_password}@{ip}:{port}/{database}"
+        endpoint = self._resolve(edge_id, prefer_ip).endpoint
+        encoded_password = _quote_plus(password)
+        return f"{driver}://{user}:{encoded_password}@{endpoint}/{database}"
 
     def resolve_source_hosts(self, edge_id: str) -> list[Host]:
         """
         Resolve all source hosts for an edge.
 
         Handles both explicit host lists and selector-based matching.
+        Results are cached per edge; each call returns a fresh list.
         """
-        edge = self.get_edge(edge_id)
-
+        hosts = self._source_hosts_cache.get(edge_id)
+        if hosts is None:
+            hosts = self._resolve_source_hosts(self.get_edge(edge_id))
+            self._source_hosts_cache[edge_id] = hosts
+        return list(hosts)
+
+    def _resolve_source_hosts(self, edge: Edge) -> list[Host]:
+        """Match an edge's source hosts against the registry."""
         # Explicit host list
         if not edge.is_wildcard_source() and edge.source_hosts:
             hosts = []
@@ -191,11 +241,7 @@ class EdgeResolver:
                 return self._registry.hosts_with_service(selector["service"])
             # Support observability.ready selection
             if "observability.ready" in selector:
-                return [
-                    h
-                    for h in self._registry.active_hosts()
-                    if h.to_dict().get("observability", {}).get("ready")
-                ]
+                return self._registry.observability_ready_hosts()
 
         # Wildcard - return all active hosts
         if edge.is_wildcard_source():
@@ -203,27 +249,41 @@ class EdgeResolver:
 
         return []
 
-    def to_template_context(self, edge_id: str, secrets: dict[str, str] | None = None) -> dict[str, Any]:
+    def to_template_context(
+        self,
+        edge_id: str,
+        secrets: dict[str, str] | None = None,
+        *,
+        prefer_ip: str = "tailscale",
+    ) -> dict[str, Any]:
         """
         Build a template context dictionary for an edge.
 
-        Useful for Jinja2 template rendering.
+        Useful for Jinja2 template rendering. ``target_ip`` and ``endpoint``
+        use the ``prefer_ip`` network.
         """
         edge = self.get_edge(edge_id)
-        target_host = self.get_target_host(edge_id)
-
-        context = {
-            "edge_id": edge.id,
-            "edge_type": edge.type.value,
-            "target_ip": target_host.get_ip("tailscale"),
-            "target_public_ip": target_host.public_ip,
-            "target_port": edge.target_port,
-            "target_service": edge.target_service,
-            "target_host_name": target_host.canonical_name,
-            "target_host_uuid": target_host.uuid,
-            "protocol": edge.protocol,
-            "endpoint": f"{target_host.get_ip('tailscale')}:{edge.target_port}",
-        }
+        key = (edge_id, prefer_ip)
+        base = self._context_cache.get(key)
+        if base is None:
+            target_host = self.get_target_host(edge_id)
+            target_ip = target_host.get_ip(prefer_ip)
+            base = {
+                "edge_id": edge.id,
+                "edge_type": edge.type.value,
+                "target_ip": target_ip,
+                "target_public_ip": target_host.public_ip,
+                "target_port": edge.target_port,
+                "target_service": edge.target_service,
+                "target_host_name": target_host.canonical_name,
+                "target_host_uuid": target_host.uuid,
+                "protocol": edge.protocol,
+                "endpoint": f"{target_ip}:{edge.target_port}",
+            }
+            self._context_cache[key] = base
+
+        # Callers get their own copy to extend
+        context = dict(base)
 
         # Add resolved URLs if secrets provided
         if secrets and edge.secret_ref and edge.secret_ref in secrets:
@@ -235,12 +295,19 @@ class EdgeResolver:
         """
         Validate all edges can be resolved.
 
-        Returns list of error messages (empty if all valid).
+        Returns list of error messages (empty if all valid). The result is
+        computed once per resolver; each call returns a fresh list.
         """
-        errors = []
-        for edge in self._edges:
-            try:
-                self.get_target_host(edge.id)
-            except ResolutionError as e:
-                errors.append(str(e))
-        return errors
+        errors = self._validation_errors
+        if errors is None:
+            # Look up each distinct target host once; most edge sets share a few targets
+            get_host = self._registry.get_by_uuid
+            targets = {edge.target_host for edge in self._edges}
+            missing = {uuid for uuid in targets if get_host(uuid) is None}
+            errors = [
+                f"Target host not found for edge {e.id}: {e.target_host}"
+                for e in self._edges
+                if e.target_host in missing
+            ]
+            self._validation_errors = errors
+        return list(errors)
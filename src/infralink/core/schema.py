@@ -5,7 +5,8 @@ from __future__ import annotations
 from enum import Enum
 from typing import Any, Literal
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, field_validator, model_validator
+from typing_extensions import TypedDict
 
 
 class HostStatus(str, Enum):
@@ -26,6 +27,8 @@ class NetworkConfig(BaseModel):
     public_ipv6: str | None = None
     private_ip: str | None = None
 
+    model_config = {"frozen": True}
+
 
 class ServiceProtocol(str, Enum):
     """Common service protocols."""
@@ -51,19 +54,39 @@ class ServiceExposure(str, Enum):
     LOCAL = "local"  # Only localhost
 
 
-class ServiceConfig(BaseModel):
+class ServiceConfig(TypedDict, total=False):
     """Service declaration on a host.
 
     Services are first-class objects with their own properties,
     enabling self-documenting registries, better health checks,
     and richer diagrams.
+
+    A typed dict rather than a model: hosts declare many services, and
+    pydantic validates typed dicts without building an object per service.
+    Absent keys take the values in SERVICE_DEFAULTS.
     """
 
-    port: int | None = None
-    protocol: str = "tcp"
-    exposure: ServiceExposure = ServiceExposure.INTERNAL
-    depends_on: list[str] = Field(default_factory=list)  # Local service dependencies
-    notes: str | None = None
+    port: int | None
+    protocol: str
+    exposure: ServiceExposure
+    depends_on: list[str]  # Local service dependencies
+    notes: str | None
+
+
+SERVICE_DEFAULTS: dict[str, Any] = {
+    "port": None,
+    "protocol": "tcp",
+    "exposure": ServiceExposure.INTERNAL,
+    "depends_on": [],
+    "notes": None,
+}
+
+
+def service_config_dict(config: ServiceConfig) -> dict[str, Any]:
+    """Return a service config as a new dict with defaults filled in."""
+    result: dict[str, Any] = {**SERVICE_DEFAULTS, **config}
+    result["depends_on"] = list(result["depends_on"])
+    return result
 
 
 class RoleConfig(BaseModel):
@@ -77,6 +100,8 @@ class RoleConfig(BaseModel):
     required_secrets: list[str] = Field(default_factory=list)
     description: str | None = None
 
+    model_config = {"frozen": True}
+
 
 class ProviderMetadata(BaseModel):
     """Cloud provider-specific metadata.
@@ -85,7 +110,7 @@ class ProviderMetadata(BaseModel):
     hcloud_project, robot_id, scaleway_server_id, etc.
     """
 
-    model_config = {"extra": "allow"}  # Allow arbitrary fields
+    model_config = {"extra": "allow", "frozen": True}  # Allow arbitrary fields
 
 
 class ObservabilityConfig(BaseModel):
@@ -102,11 +127,12 @@ class ObservabilityConfig(BaseModel):
     port_overrides: dict[str, int] = Field(default_factory=dict)  # Non-standard ports
     notes: str | None = None
 
+    model_config = {"frozen": True}
+
 
 def validate_uuid_format(uuid: str) -> bool:
     """Validate UUID format (loose check)."""
-    parts = uuid.split("-")
-    return len(parts) == 5
+    return uuid.count("-") == 4
 
 
 class HostSchema(BaseModel):
@@ -149,25 +175,28 @@ class HostSchema(BaseModel):
     # Supports both new format (dict) and legacy format (list of strings)
     services: dict[str, ServiceConfig] = Field(default_factory=dict)
 
-    @field_validator("services", mode="before")
+    @model_validator(mode="before")
     @classmethod
-    def normalize_services(cls, v: Any) -> dict[str, ServiceConfig]:
-        """Convert legacy list format to dict format."""
-        if isinstance(v, list):
-            # Legacy format: ["nginx", "postgresql"]
-            # Convert to: {"nginx": {}, "postgresql": {}}
-            return {name: {} for name in v}
-        return v
-
-    @field_validator("roles", mode="before")
-    @classmethod
-    def normalize_roles(cls, v: Any) -> list[str]:
-        """Convert legacy dict format to list format."""
-        if isinstance(v, dict):
-            # Legacy format: {"airflow-worker": {"concurrency": 10}}
-            # Convert to list, store config in role_overrides via separate validator
-            return list(v.keys())
-        return v
+    def normalize_legacy(cls, data: Any) -> Any:
+        """
+        Convert legacy formats in one pass over the raw host mapping.
+
+        services: ["nginx", "postgresql"] -> {"nginx": {}, "postgresql": {}}
+        roles: {"airflow-worker": {"concurrency": 10}} -> ["airflow-worker"]
+        """
+        if not isinstance(data, dict):
+            return data
+        services = data.get("services")
+        roles = data.get("roles")
+        if not isinstance(services, list) and not isinstance(roles, dict):
+            return data
+        # Leave the caller's mapping untouched
+        data = dict(data)
+        if isinstance(services, list):
+            data["services"] = {name: {} for name in services}
+        if isinstance(roles, dict):
+            data["roles"] = list(roles.keys())
+        return data
 
     # Secrets
     bws_project: str | None = None
@@ -190,6 +219,8 @@ class HostSchema(BaseModel):
     legacy_instances: list[str] = Field(default_factory=list)  # Old ansible names
     notes: str | None = None
 
+    model_config = {"frozen": True}
+
 
 class RegistrySchema(BaseModel):
     """
@@ -254,6 +285,8 @@ class AuthConfig(BaseModel):
     type: Literal["none", "password", "basic", "token", "certificate"] = "none"
     secret_ref: str | None = None
 
+    model_config = {"frozen": True}
+
 
 class HealthCheckConfig(BaseModel):
     """Health check configuration for an edge."""
@@ -264,6 +297,8 @@ class HealthCheckConfig(BaseModel):
     path: str | None = None  # For HTTP checks
     query: str | None = None  # For query checks
 
+    model_config = {"frozen": True}
+
 
 class EdgeSourceSelector(BaseModel):
     """Selector for edge source hosts."""
@@ -272,6 +307,8 @@ class EdgeSourceSelector(BaseModel):
     selector: dict[str, Any] | None = None  # e.g., {"role": "airflow-worker"}
     service: str | None = None
 
+    model_config = {"frozen": True}
+
 
 class EdgeTarget(BaseModel):
     """Target endpoint for an edge."""
@@ -280,6 +317,8 @@ class EdgeTarget(BaseModel):
     service: str
     port: int
 
+    model_config = {"frozen": True}
+
 
 class EdgeMetadata(BaseModel):
     """Metadata for an edge."""
@@ -290,6 +329,8 @@ class EdgeMetadata(BaseModel):
     runbook: str | None = None
     documentation: str | None = None
 
+    model_config = {"frozen": True}
+
 
 class EdgeSchema(BaseModel):
     """Schema for an edge between infrastructure nodes."""
@@ -303,7 +344,7 @@ class EdgeSchema(BaseModel):
     healthcheck: HealthCheckConfig = Field(default_factory=HealthCheckConfig)
     metadata: EdgeMetadata = Field(default_factory=EdgeMetadata)
 
-    model_config = {"populate_by_name": True}
+    model_config = {"populate_by_name": True, "frozen": True}
 
 
 class EdgeSetSchema(BaseModel):
@@ -3,7 +3,12 @@
 from infralink.generators.mermaid import generate_mermaid
 from infralink.generators.d2 import generate_d2
 from infralink.generators.dot import generate_dot
-from infralink.generators.markdown import generate_host_doc, generate_index
+from infralink.generators.markdown import (
+    generate_host_doc,
+    generate_index,
+    write_host_doc,
+    write_index,
+)
 
 __all__ = [
     "generate_mermaid",
@@ -11,4 +16,6 @@ __all__ = [
     "generate_dot",
     "generate_host_doc",
     "generate_index",
+    "write_host_doc",
+    "write_index",
 ]
@@ -2,16 +2,18 @@
 
 from __future__ import annotations
 
-from collections import defaultdict
+from itertools import groupby
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from collections.abc import Collection
+
     from infralink.core.edges import EdgeSet
     from infralink.core.registry import Host, Registry
 
 
 def generate_d2(
-    hosts: list[Host],
+    hosts: Collection[Host],
     edges: EdgeSet,
     registry: Registry,
 ) -> str:
@@ -29,39 +31,40 @@ def generate_d2(
         "",
     ]
 
-    # Group hosts
-    groups: dict[str, list[Host]] = defaultdict(list)
-    for host in hosts:
-        group = host.group or "other"
-        groups[group].append(host)
+    # One sort by (group, name) orders both the groups and the hosts within
+    # them. Node IDs are collected as hosts are drawn, making the edge loop's
+    # membership checks O(1)
+    ordered = sorted(hosts, key=lambda h: (h.group or "other", h.canonical_name))
+    host_prefixes: set[str] = set()
 
     # Define groups as containers
-    for group, group_hosts in sorted(groups.items()):
+    for group, group_hosts in groupby(ordered, key=lambda h: h.group or "other"):
         lines.append(f"{group}: {{")
         lines.append(f"  label: {group.upper()}")
-        lines.append("  style: {{")
+        lines.append("  style: {")
         lines.append("    fill: transparent")
         lines.append("    stroke: '#888'")
         lines.append("    stroke-dash: 3")
-        lines.append("  }}")
+        lines.append("  }")
         lines.append("")
 
-        for host in sorted(group_hosts, key=lambda h: h.canonical_name):
+        for host in group_hosts:
             node_id = host.uuid[:8]
+            host_prefixes.add(node_id)
             lines.append(f"  {node_id}: {{")
             lines.append(f"    label: {host.canonical_name}")
             lines.append("    shape: rectangle")
 
             # Add services as nested items (limit to 5)
-            services = host.services[:5]
+            services = host.service_names[:5]
             if services:
                 for svc in services:
                     svc_id = svc.replace("-", "_")
                     lines.append(f"    {svc_id}: {svc}")
 
-            lines.append("  }}")
+            lines.append("  }")
 
-        lines.append("}}")
+        lines.append("}")
         lines.append("")
 
     # Add edges
@@ -74,12 +77,16 @@ def generate_d2(
 
         target_id = edge.target_host[:8]
         target_host = registry.get_by_uuid(edge.target_host)
-        target_group = target_host.group if target_host else "other"
+        target_group = (target_host.group if target_host else None) or "other"
+        target_path = f"{target_group}.{target_id}"
+        # Style based on criticality; the same for every source of this edge
+        style = " { style.stroke: '#e74c3c'; style.stroke-width: 2 }" if edge.is_critical else ""
+        label = f"{edge.target_service}:{edge.target_port}"
 
         for source_uuid in edge.source_hosts:
             source_id = source_uuid[:8]
             source_host = registry.get_by_uuid(source_uuid)
-            source_group = source_host.group if source_host else "other"
+            source_group = (source_host.group if source_host else None) or "other"
 
             # Skip duplicates
             edge_key = (source_id, target_id)
@@ -88,22 +95,11 @@ def generate_d2(
             seen_edges.add(edge_key)
 
             # Check if both hosts are in our list
-            source_in_list = any(h.uuid.startswith(source_id) for h in hosts)
-            target_in_list = any(h.uuid.startswith(target_id) for h in hosts)
-
-            if not (source_in_list and target_in_list):
+            if not (source_id in host_prefixes and target_id in host_prefixes):
                 continue
 
             # Build connection
             source_path = f"{source_group}.{source_id}"
-            target_path = f"{target_group}.{target_id}"
-
-            # Style based on criticality
-            style = ""
-            if edge.is_critical:
-                style = " { style.stroke: '#e74c3c'; style.stroke-width: 2 }"
-
-            label = f"{edge.target_service}:{edge.target_port}"
             lines.append(f"{source_path} -> {target_path}: {label}{style}")
 
     return "\n".join(lines)
@@ -2,16 +2,18 @@
 
 from __future__ import annotations
 
-from collections import defaultdict
+from itertools import groupby
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from collections.abc import Collection
+
     from infralink.core.edges import EdgeSet
     from infralink.core.registry import Host, Registry
 
 
 def generate_dot(
-    hosts: list[Host],
+    hosts: Collection[Host],
     edges: EdgeSet,
     registry: Registry,
 ) -> str:
@@ -28,21 +30,22 @@ def generate_dot(
         "",
     ]
 
-    # Group hosts
-    groups: dict[str, list[Host]] = defaultdict(list)
-    for host in hosts:
-        group = host.group or "other"
-        groups[group].append(host)
+    # One sort by (group, name) orders both the groups and the hosts within
+    # them. Node IDs are collected as hosts are drawn, making the edge loop's
+    # membership checks O(1)
+    ordered = sorted(hosts, key=lambda h: (h.group or "other", h.canonical_name))
+    host_prefixes: set[str] = set()
 
     # Define subgraphs for each group
-    for group, group_hosts in sorted(groups.items()):
+    for group, group_hosts in groupby(ordered, key=lambda h: h.group or "other"):
         lines.append(f"    subgraph cluster_{group} {{")
         lines.append(f'        label="{group}";')
         lines.append("        style=dashed;")
         lines.append("        color=gray;")
         lines.append("")
 
-        for host in sorted(group_hosts, key=lambda h: h.canonical_name):
+        for host in group_hosts:
+            host_prefixes.add(host.uuid[:8])
             node_id = f"n_{host.uuid[:8]}"
             label = host.canonical_name
 
@@ -65,7 +68,11 @@ def generate_dot(
         if edge.is_wildcard_source():
             continue
 
-        target_id = f"n_{edge.target_host[:8]}"
+        target_prefix = edge.target_host[:8]
+        target_id = f"n_{target_prefix}"
+        # Style based on criticality; the same for every source of this edge
+        style = "color=red, penwidth=2" if edge.is_critical else "color=black"
+        label = f"{edge.target_service}:{edge.target_port}"
 
         for source_uuid in edge.source_hosts:
             source_id = f"n_{source_uuid[:8]}"
@@ -77,19 +84,9 @@ def generate_dot(
             seen_edges.add(edge_key)
 
             # Check if both hosts are in our list
-            source_in_list = any(h.uuid[:8] in source_id for h in hosts)
-            target_in_list = any(h.uuid[:8] in target_id for h in hosts)
-
-            if not (source_in_list and target_in_list):
+            if not (source_uuid[:8] in host_prefixes and target_prefix in host_prefixes):
                 continue
 
-            # Style based on criticality
-            if edge.is_critical:
-                style = 'color=red, penwidth=2'
-            else:
-                style = 'color=black'
-
-            label = f"{edge.target_service}:{edge.target_port}"
             lines.append(f'    {source_id} -> {target_id} [label="{label}", {style}];')
 
     lines.append("}")
@@ -2,21 +2,67 @@
 
 from __future__ import annotations
 
+from collections import Counter
 from datetime import datetime
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+    from typing import TextIO
+
     from infralink.core.edges import EdgeSet
     from infralink.core.registry import Host, Registry
 
 
+def _host_name(registry: Registry, uuid: str) -> str:
+    """Canonical name of a host, or its UUID prefix if it is not in the registry."""
+    host = registry.get_by_uuid(uuid)
+    return host.canonical_name if host else uuid[:8]
+
+
+def _write_lines(out: TextIO, lines: Iterable[str]) -> None:
+    """Write lines to ``out`` separated by newlines, with no trailing newline."""
+    it = iter(lines)
+    for line in it:
+        out.write(line)
+        break
+    for line in it:
+        out.write("\n")
+        out.write(line)
+
+
 def generate_host_doc(
     host: Host,
     edges: EdgeSet,
     registry: Registry,
+    generated_at: str | None = None,
 ) -> str:
-    """Generate Markdown documentation for a single host."""
-    lines = [
+    """
+    Generate Markdown documentation for a single host.
+
+    Pass ``generated_at`` to stamp a batch of documents with one time.
+    """
+    return "\n".join(_host_doc_lines(host, edges, registry, generated_at))
+
+
+def write_host_doc(
+    out: TextIO,
+    host: Host,
+    edges: EdgeSet,
+    registry: Registry,
+    generated_at: str | None = None,
+) -> None:
+    """Write the Markdown documentation for a single host to ``out``."""
+    _write_lines(out, _host_doc_lines(host, edges, registry, generated_at))
+
+
+def _host_doc_lines(
+    host: Host,
+    edges: EdgeSet,
+    registry: Registry,
+    generated_at: str | None,
+) -> Iterator[str]:
+    yield from [
         f"# {host.canonical_name}",
         "",
         f"**UUID:** `{host.uuid}`  ",
@@ -34,90 +80,101 @@ def generate_host_doc(
     ]
 
     # Services
-    lines.extend([
+    yield from [
         "## Services",
         "",
-    ])
+    ]
 
-    if host.services:
-        lines.append("| Service | Status |")
-        lines.append("|---------|--------|")
-        for svc in host.services:
-            lines.append(f"| {svc} | Active |")
+    if host.service_names:
+        yield "| Service | Status |"
+        yield "|---------|--------|"
+        yield from (f"| {svc} | Active |" for svc in host.service_names)
     else:
-        lines.append("*No services declared*")
+        yield "*No services declared*"
 
-    lines.append("")
+    yield ""
 
     # Inbound connections
     inbound = edges.targeting_host(host.uuid)
     if inbound:
-        lines.extend([
+        yield from [
             "## Inbound Connections",
             "",
             "| Source | Service | Port | Protocol | Criticality |",
             "|--------|---------|------|----------|-------------|",
-        ])
+        ]
 
         for edge in inbound:
             source_hosts = edge.source_hosts
             if edge.is_wildcard_source():
-                source_names = ["*"]
+                sources_str = "*"
             else:
-                source_names = []
-                for src_uuid in source_hosts[:3]:  # Limit display
-                    src_host = registry.get_by_uuid(src_uuid)
-                    if src_host:
-                        source_names.append(src_host.canonical_name)
-                    else:
-                        source_names.append(src_uuid[:8])
-
-            sources_str = ", ".join(source_names)
+                # Limit display
+                sources_str = ", ".join(_host_name(registry, u) for u in source_hosts[:3])
             if len(source_hosts) > 3:
                 sources_str += f" (+{len(source_hosts) - 3} more)"
 
-            lines.append(
+            yield (
                 f"| {sources_str} | {edge.target_service} | {edge.target_port} | "
                 f"{edge.protocol or '-'} | {edge.criticality.value} |"
             )
 
-        lines.append("")
+        yield ""
 
     # Outbound connections
     outbound = edges.from_host(host.uuid)
     if outbound:
-        lines.extend([
+        yield from [
             "## Outbound Connections",
             "",
             "| Target | Service | Port | Purpose |",
             "|--------|---------|------|---------|",
-        ])
-
-        for edge in outbound:
-            target_host = registry.get_by_uuid(edge.target_host)
-            target_name = target_host.canonical_name if target_host else edge.target_host[:8]
-            purpose = edge.purpose or "-"
-            lines.append(
-                f"| {target_name} | {edge.target_service} | {edge.target_port} | {purpose} |"
-            )
+        ]
+
+        yield from (
+            f"| {_host_name(registry, edge.target_host)} | {edge.target_service} | "
+            f"{edge.target_port} | {edge.purpose or '-'} |"
+            for edge in outbound
+        )
 
-        lines.append("")
+        yield ""
 
     # Footer
-    lines.extend([
+    yield from [
         "---",
-        f"*Generated: {datetime.now().isoformat()}*",
-    ])
+        f"*Generated: {generated_at or datetime.now().isoformat()}*",
+    ]
+
 
-    return "\n".join(lines)
+def _service_summary(host: Host) -> str:
+    """First three service names, with an ellipsis if there are more."""
+    names = host.service_names
+    summary = ", ".join(names[:3])
+    return summary + "..." if len(names) > 3 else summary
 
 
-def generate_index(registry: Registry, edges: EdgeSet) -> str:
+def generate_index(
+    registry: Registry, edges: EdgeSet, generated_at: str | None = None
+) -> str:
     """Generate index page listing all hosts."""
-    lines = [
+    return "\n".join(_index_lines(registry, edges, generated_at))
+
+
+def write_index(
+    out: TextIO, registry: Registry, edges: EdgeSet, generated_at: str | None = None
+) -> None:
+    """Write the host index page to ``out``."""
+    _write_lines(out, _index_lines(registry, edges, generated_at))
+
+
+def _index_lines(
+    registry: Registry, edges: EdgeSet, generated_at: str | None
+) -> Iterator[str]:
+    active_hosts = registry.active_hosts()
+    yield from [
         "# Infrastructure Host Index",
         "",
-        f"Total hosts: {len(registry)} ({len(registry.active_hosts())} active)  ",
+        f"Total hosts: {len(registry)} ({len(active_hosts)} active)  ",
         f"Total edges: {len(edges)}  ",
         "",
         "## Active Hosts",
@@ -126,53 +183,70 @@ def generate_index(registry: Registry, edges: EdgeSet) -> str:
         "|------|------|-------|-------|----------|",
     ]
 
-    for host in sorted(registry.active_hosts(), key=lambda h: h.canonical_name):
-        services = ", ".join(host.services[:3])
-        if len(host.services) > 3:
-            services += "..."
+    yield from (
+        f"| [{host.canonical_name}]({host.canonical_name}.md) | "
+        f"`{host.uuid_prefix}...` | {host.group or '-'} | "
+        f"{host.cloud or '-'} | {_service_summary(host)} |"
+        for host in sorted(active_hosts, key=lambda h: h.canonical_name)
+    )
 
-        lines.append(
-            f"| [{host.canonical_name}]({host.canonical_name}.md) | "
-            f"`{host.uuid_prefix}...` | {host.group or '-'} | "
-            f"{host.cloud or '-'} | {services} |"
-        )
+    # Active host counts per group and cloud, in one pass
+    group_counts: Counter[str | None] = Counter()
+    cloud_counts: Counter[str | None] = Counter()
+    for host in active_hosts:
+        group_counts[host.group] += 1
+        cloud_counts[host.cloud] += 1
 
     # Groups summary
-    lines.extend([
+    yield from [
         "",
         "## By Group",
         "",
-    ])
+    ]
 
     for group in sorted(registry.groups()):
-        hosts_in_group = registry.filter(group=group)
-        active_count = len([h for h in hosts_in_group if h.is_active])
-        lines.append(f"- **{group}**: {active_count} active hosts")
+        yield f"- **{group}**: {group_counts[group]} active hosts"
 
     # Clouds summary
-    lines.extend([
+    yield from [
         "",
         "## By Cloud Provider",
         "",
-    ])
+    ]
 
     for cloud in sorted(registry.clouds()):
-        hosts_in_cloud = registry.filter(cloud=cloud)
-        active_count = len([h for h in hosts_in_cloud if h.is_active])
-        lines.append(f"- **{cloud}**: {active_count} active hosts")
+        yield f"- **{cloud}**: {cloud_counts[cloud]} active hosts"
 
-    lines.extend([
+    yield from [
         "",
         "---",
-        f"*Generated: {datetime.now().isoformat()}*",
-    ])
-
-    return "\n".join(lines)
+        f"*Generated: {generated_at or datetime.now().isoformat()}*",
+    ]
 
 
-def generate_edge_index(edges: EdgeSet, registry: Registry) -> str:
+def generate_edge_index(
+    edges: EdgeSet, registry: Registry, generated_at: str | None = None
+) -> str:
     """Generate index page listing all edges."""
-    lines = [
+    return "\n".join(_edge_index_lines(edges, registry, generated_at))
+
+
+def write_edge_index(
+    out: TextIO, edges: EdgeSet, registry: Registry, generated_at: str | None = None
+) -> None:
+    """
+    Write the edge index page to ``out``.
+
+    Rows are written as they are formatted, so large edge sets are never
+    held in memory as one string.
+    """
+    _write_lines(out, _edge_index_lines(edges, registry, generated_at))
+
+
+def _edge_index_lines(
+    edges: EdgeSet, registry: Registry, generated_at: str | None
+) -> Iterator[str]:
+    yield from [
         "# Infrastructure Edge Index",
         "",
         f"Total edges: {len(edges)}  ",
@@ -184,38 +258,30 @@ def generate_edge_index(edges: EdgeSet, registry: Registry) -> str:
         "|----|------|--------|------|-------------|---------|",
     ]
 
-    for edge in sorted(edges, key=lambda e: e.id):
-        target_host = registry.get_by_uuid(edge.target_host)
-        target_name = target_host.canonical_name if target_host else edge.target_host[:8]
-
-        if edge.is_wildcard_source():
-            sources = "*"
-        else:
-            sources = str(len(edge.source_hosts))
-
-        lines.append(
-            f"| {edge.id} | {edge.type.value} | {target_name}/{edge.target_service} | "
-            f"{edge.target_port} | {edge.criticality.value} | {sources} |"
-        )
+    yield from (
+        f"| {edge.id} | {edge.type.value} | "
+        f"{_host_name(registry, edge.target_host)}/{edge.target_service} | "
+        f"{edge.target_port} | {edge.criticality.value} | "
+        f"{'*' if edge.is_wildcard_source() else edge.source_host_count} |"
+        for edge in sorted(edges, key=lambda e: e.id)
+    )
 
     # By type
-    lines.extend([
+    yield from [
         "",
         "## By Type",
         "",
-    ])
+    ]
 
     from infralink.core.schema import EdgeType
 
     for etype in EdgeType:
         type_edges = edges.by_type(etype)
         if type_edges:
-            lines.append(f"- **{etype.value}**: {len(type_edges)} edges")
+            yield f"- **{etype.value}**: {len(type_edges)} edges"
 
-    lines.extend([
+    yield from [
         "",
         "---",
-        f"*Generated: {datetime.now().isoformat()}*",
-    ])
-
-    return "\n".join(lines)
+        f"*Generated: {generated_at or datetime.now().isoformat()}*",
+    ]
@@ -2,16 +2,18 @@
 
 from __future__ import annotations
 
-from collections import defaultdict
+from itertools import groupby
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from collections.abc import Collection
+
     from infralink.core.edges import EdgeSet
     from infralink.core.registry import Host, Registry
 
 
 def generate_mermaid(
-    hosts: list[Host],
+    hosts: Collection[Host],
     edges: EdgeSet,
     registry: Registry,
 ) -> str:
@@ -22,17 +24,18 @@ def generate_mermaid(
     """
     lines = ["# Infrastructure Topology", "", "```mermaid", "flowchart LR"]
 
-    # Group hosts by group
-    groups: dict[str, list[Host]] = defaultdict(list)
-    for host in hosts:
-        group = host.group or "other"
-        groups[group].append(host)
+    # One sort by (group, name) orders both the groups and the hosts within
+    # them. Node IDs are collected as hosts are drawn, making the edge loop's
+    # membership checks O(1)
+    ordered = sorted(hosts, key=lambda h: (h.group or "other", h.canonical_name))
+    host_prefixes: set[str] = set()
 
     # Define subgraphs for each group
-    for group, group_hosts in sorted(groups.items()):
+    for group, group_hosts in groupby(ordered, key=lambda h: h.group or "other"):
         lines.append(f"    subgraph {group}")
-        for host in sorted(group_hosts, key=lambda h: h.canonical_name):
+        for host in group_hosts:
             node_id = host.uuid[:8]
+            host_prefixes.add(node_id)
             # Escape special characters
             label = host.canonical_name.replace("-", "_")
             lines.append(f"        {node_id}[{label}]")
@@ -48,6 +51,9 @@ def generate_mermaid(
             continue
 
         target_id = edge.target_host[:8]
+        # Style based on criticality; the same for every source of this edge
+        arrow = "==>" if edge.is_critical else "-->"
+        label = edge.target_service
 
         for source_uuid in edge.source_hosts:
             source_id = source_uuid[:8]
@@ -59,19 +65,9 @@ def generate_mermaid(
             seen_edges.add(edge_key)
 
             # Check if source and target are in our host list
-            source_in_list = any(h.uuid.startswith(source_id) for h in hosts)
-            target_in_list = any(h.uuid.startswith(target_id) for h in hosts)
-
-            if not (source_in_list and target_in_list):
+            if not (source_id in host_prefixes and target_id in host_prefixes):
                 continue
 
-            # Style based on criticality
-            if edge.is_critical:
-                arrow = "==>"
-            else:
-                arrow = "-->"
-
-            label = edge.target_service
             lines.append(f"    {source_id} {arrow}|{label}| {target_id}")
 
     lines.append("```")
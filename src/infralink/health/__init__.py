@@ -1,5 +1,17 @@
 """Health check utilities for infrastructure edges."""
 
-from infralink.health.checks import check_edge_health, HealthCheckResult
+from infralink.health.checks import (
+    check_edge_health,
+    close_http_connections,
+    HealthCheckResult,
+    HttpConnectionPool,
+    results_to_json,
+)
 
-__all__ = ["check_edge_health", "HealthCheckResult"]
+__all__ = [
+    "check_edge_health",
+    "close_http_connections",
+    "HealthCheckResult",
+    "HttpConnectionPool",
+    "results_to_json",
+]
@@ -2,16 +2,27 @@
 
 from __future__ import annotations
 
+import asyncio
+import errno
+import math
+import os
+import selectors
 import socket
+import threading
 import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Any
+from typing import TYPE_CHECKING, Any, Iterable
 
 from infralink.core.edges import Edge
 from infralink.core.resolver import EdgeResolver, ResolutionError
 
+if TYPE_CHECKING:
+    import http.client
 
-@dataclass
+
+@dataclass(slots=True)
 class HealthCheckResult:
     """Result of a health check."""
 
@@ -40,23 +51,37 @@ class HealthCheckResult:
         }
 
 
+try:
+    import orjson
+
+    def results_to_json(results: list[HealthCheckResult]) -> str:
+        """Serialize results as an indented JSON array of their to_dict() fields."""
+        # orjson serializes the dataclasses directly, in field order
+        return orjson.dumps(results, option=orjson.OPT_INDENT_2).decode()
+
+except ImportError:  # pragma: no cover - optional dependency
+    import json
+
+    def results_to_json(results: list[HealthCheckResult]) -> str:
+        """Serialize results as an indented JSON array of their to_dict() fields."""
+        return json.dumps([r.to_dict() for r in results], indent=2)
+
+
 def check_tcp(host: str, port: int, timeout: int = 5) -> tuple[bool, float | None, str | None]:
     """
     Perform TCP connectivity check.
 
     Returns (healthy, latency_ms, error_message).
     """
+    start = time.monotonic()
     try:
-        start = time.monotonic()
-        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        sock.settimeout(timeout)
-        result = sock.connect_ex((host, port))
+        # create_connection resolves the address and tries IPv6 as well as IPv4
+        with socket.create_connection((host, port), timeout=timeout):
+            latency = (time.monotonic() - start) * 1000
+        return True, latency, None
+    except ConnectionRefusedError as e:
         latency = (time.monotonic() - start) * 1000
-        sock.close()
-
-        if result == 0:
-            return True, latency, None
-        return False, latency, f"Connection refused (code: {result})"
+        return False, latency, f"Connection refused (code: {e.errno})"
     except socket.timeout:
         return False, None, "Connection timed out"
     except socket.gaierror as e:
@@ -65,38 +90,286 @@ def check_tcp(host: str, port: int, timeout: int = 5) -> tuple[bool, float | Non
         return False, None, f"Network error: {e}"
 
 
+def summarize_latencies(results: list[HealthCheckResult]) -> tuple[float, float, float] | None:
+    """
+    Summarize measured latencies as (p50, p95, mean) in milliseconds.
+
+    Percentiles use the nearest-rank method. Returns None when no result
+    measured a latency.
+    """
+    latencies = sorted(r.latency_ms for r in results if r.latency_ms is not None)
+    if not latencies:
+        return None
+    n = len(latencies)
+    p50 = latencies[math.ceil(0.50 * n) - 1]
+    p95 = latencies[math.ceil(0.95 * n) - 1]
+    return p50, p95, math.fsum(latencies) / n
+
+
+# Sockets in flight at once in batch_tcp_probe, well under common fd limits
+_PROBE_MAX_IN_FLIGHT = 512
+
+_ProbeAddress = tuple[int, int, int, Any]
+
+
+def batch_tcp_probe(
+    targets: list[tuple[str, int]], timeout: float = 5
+) -> list[tuple[bool, float | None, str | None]]:
+    """
+    Perform TCP connectivity checks for many targets from one thread.
+
+    Connects are issued non-blocking and awaited together on a selector, so
+    a batch takes about as long as its slowest target rather than the sum.
+    At most ``_PROBE_MAX_IN_FLIGHT`` sockets are open at once, and each gets
+    ``timeout`` seconds from its own connect. Only the first resolved address
+    of each target is tried.
+
+    Returns (healthy, latency_ms, error_message) per target, in order.
+    """
+    outcomes: list[tuple[bool, float | None, str | None] | None] = [None] * len(targets)
+    addresses = _probe_addresses(targets)
+    starts: dict[int, float] = {}
+    # (deadline, index, socket) in connect order, so deadlines are ascending
+    in_flight: deque[tuple[float, int, socket.socket]] = deque()
+    next_index = 0
+    with selectors.DefaultSelector() as sel:
+        try:
+            while next_index < len(targets) or sel.get_map():
+                while next_index < len(targets) and len(sel.get_map()) < _PROBE_MAX_IN_FLIGHT:
+                    i = next_index
+                    next_index += 1
+                    address = addresses[i]
+                    if isinstance(address, str):
+                        outcomes[i] = (False, None, address)
+                        continue
+                    starts[i] = time.monotonic()
+                    started = _start_connect(address, starts[i])
+                    if isinstance(started, tuple):
+                        outcomes[i] = started
+                        continue
+                    sel.register(started, selectors.EVENT_WRITE, i)
+                    in_flight.append((starts[i] + timeout, i, started))
+
+                now = time.monotonic()
+                while in_flight and in_flight[0][0] <= now:
+                    _, i, sock = in_flight.popleft()
+                    if outcomes[i] is None:
+                        outcomes[i] = (False, None, "Connection timed out")
+                        sel.unregister(sock)
+                        sock.close()
+                if not sel.get_map():
+                    continue
+
+                for key, _ in sel.select(in_flight[0][0] - now):
+                    sock = key.fileobj  # type: ignore[assignment]
+                    err = sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR)
+                    outcomes[key.data] = _connect_outcome(err, starts[key.data])
+                    sel.unregister(sock)
+                    sock.close()
+        finally:
+            # Only reached with sockets still open if the loop raised
+            for key in list(sel.get_map().values()):
+                sel.unregister(key.fileobj)
+                key.fileobj.close()  # type: ignore[union-attr]
+    return outcomes  # type: ignore[return-value]
+
+
+def _probe_addresses(targets: list[tuple[str, int]]) -> list[_ProbeAddress | str]:
+    """
+    Resolve each target to its first stream address, or a DNS error message.
+
+    Numeric hosts (the usual case, as edge targets are resolved to IPs) are
+    parsed without a lookup; hostnames are looked up concurrently.
+    """
+    addresses: list[_ProbeAddress | str | None] = [None] * len(targets)
+    lookups: dict[tuple[str, int], list[int]] = {}
+    for i, (host, port) in enumerate(targets):
+        try:
+            info = socket.getaddrinfo(
+                host, port, type=socket.SOCK_STREAM, flags=socket.AI_NUMERICHOST
+            )
+        except socket.gaierror:
+            lookups.setdefault((host, port), []).append(i)
+            continue
+        addresses[i] = info[0][:3] + (info[0][4],)
+
+    def lookup(target: tuple[str, int]) -> _ProbeAddress | str:
+        try:
+            info = socket.getaddrinfo(*target, type=socket.SOCK_STREAM)
+        except socket.gaierror as e:
+            return f"DNS resolution failed: {e}"
+        return info[0][:3] + (info[0][4],)
+
+    if lookups:
+        with ThreadPoolExecutor(max_workers=min(32, len(lookups))) as ex:
+            for indexes, address in zip(lookups.values(), ex.map(lookup, lookups)):
+                for i in indexes:
+                    addresses[i] = address
+    return addresses  # type: ignore[return-value]
+
+
+def _start_connect(
+    address: _ProbeAddress, start: float
+) -> socket.socket | tuple[bool, float | None, str | None]:
+    """
+    Begin a non-blocking connect, returning the socket while it is in progress.
+
+    Connects that finish or fail at once, including running out of file
+    descriptors, return their outcome instead, with the socket closed.
+    """
+    family, type_, proto, addr = address
+    try:
+        sock = socket.socket(family, type_, proto)
+    except OSError as e:
+        return False, None, f"Network error: {e}"
+    try:
+        sock.setblocking(False)
+        err = sock.connect_ex(addr)
+    except OSError as e:
+        sock.close()
+        return False, None, f"Network error: {e}"
+    if err in (errno.EINPROGRESS, errno.EWOULDBLOCK):
+        return sock
+    sock.close()
+    return _connect_outcome(err, start)
+
+
+def _connect_outcome(err: int, start: float) -> tuple[bool, float | None, str | None]:
+    """Map a connect() errno to a check_tcp-style outcome."""
+    if err == 0:
+        return True, (time.monotonic() - start) * 1000, None
+    if err == errno.ECONNREFUSED:
+        return False, (time.monotonic() - start) * 1000, f"Connection refused (code: {err})"
+    return False, None, f"Network error: {OSError(err, os.strerror(err))}"
+
+
+class HttpConnectionPool:
+    """
+    Keep-alive HTTP connections for check_http, one per thread and target.
+
+    Safe to share across threads; each thread gets its own connections, keyed
+    by (host, port, https). close() closes them all, from any thread.
+    """
+
+    def __init__(self) -> None:
+        self._local = threading.local()
+        # Every thread's connections by id, so close() can reach those of finished threads
+        self._pools: dict[int, dict[tuple[str, int, bool], http.client.HTTPConnection]] = {}
+        self._lock = threading.Lock()
+
+    def get(
+        self, host: str, port: int, https: bool, timeout: int
+    ) -> tuple[http.client.HTTPConnection, bool]:
+        """Return this thread's connection to a target and whether it was reused."""
+        import http.client
+
+        pool: dict[tuple[str, int, bool], http.client.HTTPConnection]
+        pool = self._local.__dict__.setdefault("pool", {})
+        key = (host, port, https)
+        conn = pool.get(key)
+        if conn is not None:
+            conn.timeout = timeout
+            if conn.sock is not None:
+                conn.sock.settimeout(timeout)
+            return conn, True
+        if not pool:
+            # New or emptied by close(); (re-)register it
+            with self._lock:
+                self._pools[id(pool)] = pool
+        conn_cls = http.client.HTTPSConnection if https else http.client.HTTPConnection
+        conn = pool[key] = conn_cls(host, port, timeout=timeout)
+        return conn, False
+
+    def drop(self, host: str, port: int, https: bool) -> None:
+        """Close and forget this thread's connection to a target."""
+        conn = self._local.__dict__.get("pool", {}).pop((host, port, https), None)
+        if conn is not None:
+            conn.close()
+
+    def close(self) -> None:
+        """Close every connection in the pool, across all threads."""
+        with self._lock:
+            pools = list(self._pools.values())
+            self._pools.clear()
+        for pool in pools:
+            for conn in pool.values():
+                conn.close()
+            pool.clear()
+
+
+# Used by check_http when no pool is passed
+_default_http_pool = HttpConnectionPool()
+
+
+def close_http_connections() -> None:
+    """
+    Close the keep-alive connections check_http holds when called without a pool.
+
+    check_all_edges uses a pool of its own and closes it itself.
+    """
+    _default_http_pool.close()
+
+
+# Response bodies up to this size are drained so the connection can be reused
+_HTTP_DRAIN_LIMIT = 64 * 1024
+
+
+def _http_get(conn: http.client.HTTPConnection, path: str) -> http.client.HTTPResponse:
+    """Send a GET and drain up to _HTTP_DRAIN_LIMIT bytes of the response body."""
+    conn.request("GET", path)
+    response = conn.getresponse()
+    response.read(_HTTP_DRAIN_LIMIT)
+    return response
+
+
 def check_http(
     host: str,
     port: int,
     path: str = "/",
     timeout: int = 5,
     https: bool = False,
+    pool: HttpConnectionPool | None = None,
 ) -> tuple[bool, float | None, str | None]:
     """
     Perform HTTP health check.
 
+    Connections are kept alive in ``pool`` and reused by later checks of the
+    same target from the same thread; without a pool, a module-wide one that
+    close_http_connections() closes is used. Redirects are not followed; a 3xx
+    counts as healthy.
+
     Returns (healthy, latency_ms, error_message).
     """
-    import urllib.request
-    import urllib.error
-
-    protocol = "https" if https else "http"
-    url = f"{protocol}://{host}:{port}{path}"
+    import http.client
 
+    if pool is None:
+        pool = _default_http_pool
+    conn, reused = pool.get(host, port, https, timeout)
+    start = time.monotonic()
     try:
-        start = time.monotonic()
-        request = urllib.request.Request(url, method="GET")
-        with urllib.request.urlopen(request, timeout=timeout) as response:
-            latency = (time.monotonic() - start) * 1000
-            if 200 <= response.status < 400:
-                return True, latency, None
-            return False, latency, f"HTTP {response.status}"
-    except urllib.error.HTTPError as e:
-        return False, None, f"HTTP {e.code}: {e.reason}"
-    except urllib.error.URLError as e:
-        return False, None, f"URL error: {e.reason}"
-    except Exception as e:
+        try:
+            response = _http_get(conn, path)
+        except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+            if not reused:
+                raise
+            # The server closed an idle keep-alive connection; retry once on a new one
+            pool.drop(host, port, https)
+            conn, _ = pool.get(host, port, https, timeout)
+            start = time.monotonic()
+            response = _http_get(conn, path)
+    except OSError as e:
+        pool.drop(host, port, https)
+        return False, None, f"URL error: {e}"
+    except http.client.HTTPException as e:
+        pool.drop(host, port, https)
         return False, None, f"Request failed: {e}"
+    latency = (time.monotonic() - start) * 1000
+    if response.will_close or not response.isclosed():
+        # Closing, or the body was too large to drain
+        pool.drop(host, port, https)
+    if 200 <= response.status < 400:
+        return True, latency, None
+    return False, None, f"HTTP {response.status}: {response.reason}"
 
 
 def check_redis_ping(host: str, port: int, timeout: int = 5) -> tuple[bool, float | None, str | None]:
@@ -107,17 +380,14 @@ def check_redis_ping(host: str, port: int, timeout: int = 5) -> tuple[bool, floa
     """
     try:
         start = time.monotonic()
-        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        sock.settimeout(timeout)
-        sock.connect((host, port))
-
-        # Send PING command
-        sock.sendall(b"*1\r\n$4\r\nPING\r\n")
+        with socket.create_connection((host, port), timeout=timeout) as sock:
+            # Send the PING immediately rather than waiting on Nagle's algorithm
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            sock.sendall(b"*1\r\n$4\r\nPING\r\n")
 
-        # Read response
-        response = sock.recv(1024)
-        latency = (time.monotonic() - start) * 1000
-        sock.close()
+            # Read response
+            response = sock.recv(1024)
+            latency = (time.monotonic() - start) * 1000
 
         if b"+PONG" in response:
             return True, latency, None
@@ -129,22 +399,97 @@ def check_redis_ping(host: str, port: int, timeout: int = 5) -> tuple[bool, floa
         return False, None, f"Redis check failed: {e}"
 
 
-def check_edge_health(
-    edge: Edge,
-    resolver: EdgeResolver,
-    timeout: int = 5,
-) -> HealthCheckResult:
+async def check_tcp_async(
+    host: str, port: int, timeout: int = 5
+) -> tuple[bool, float | None, str | None]:
     """
-    Perform health check for an edge.
+    Perform TCP connectivity check on the running event loop.
 
-    Automatically selects appropriate check based on edge type and configuration.
+    Returns (healthy, latency_ms, error_message).
     """
-    timestamp = time.time()
+    start = time.monotonic()
+    try:
+        _, writer = await asyncio.wait_for(asyncio.open_connection(host, port), timeout)
+    except asyncio.TimeoutError:
+        return False, None, "Connection timed out"
+    except socket.gaierror as e:
+        return False, None, f"DNS resolution failed: {e}"
+    except ConnectionRefusedError as e:
+        latency = (time.monotonic() - start) * 1000
+        return False, latency, f"Connection refused (code: {e.errno})"
+    except OSError as e:
+        return False, None, f"Network error: {e}"
+    latency = (time.monotonic() - start) * 1000
+    writer.close()
+    try:
+        await writer.wait_closed()
+    except OSError:
+        # Connected is all that is checked; a reset while closing does not matter
+        pass
+    return True, latency, None
 
+
+async def check_redis_ping_async(
+    host: str, port: int, timeout: int = 5
+) -> tuple[bool, float | None, str | None]:
+    """
+    Perform Redis PING check on the running event loop.
+
+    Returns (healthy, latency_ms, error_message).
+    """
+
+    async def ping() -> bytes:
+        reader, writer = await asyncio.open_connection(host, port)
+        try:
+            writer.write(b"*1\r\n$4\r\nPING\r\n")
+            await writer.drain()
+            return await reader.read(1024)
+        finally:
+            writer.close()
+
+    try:
+        start = time.monotonic()
+        response = await asyncio.wait_for(ping(), timeout)
+        latency = (time.monotonic() - start) * 1000
+    except asyncio.TimeoutError:
+        return False, None, "Redis check failed: timed out"
+    except Exception as e:
+        return False, None, f"Redis check failed: {e}"
+
+    if b"+PONG" in response:
+        return True, latency, None
+    if b"-NOAUTH" in response:
+        # Auth required but service is responding
+        return True, latency, "Auth required"
+    return False, latency, f"Unexpected response: {response[:50]!r}"
+
+
+def _plan_check(edge: Edge) -> tuple[str, str | None]:
+    """
+    Pick the check to run for an edge.
+
+    Returns (check_type, http_path); the path is None for non-HTTP checks.
+    """
+    check_config = edge.healthcheck
+    check_type = check_config.type.value
+    if check_type in ("http", "https"):
+        return check_type, check_config.path or "/"
+    if check_type == "api":
+        # Generic API check (HTTP GET)
+        return check_type, check_config.path or "/health"
+    if check_type == "ping":
+        return check_type, None
+    # Default to TCP check
+    return "tcp", None
+
+
+def _resolve_endpoint(
+    edge: Edge, resolver: EdgeResolver, target_ip: str | None, timestamp: float
+) -> tuple[str, int] | HealthCheckResult:
+    """Resolve an edge's target to (ip, port), or a failed result if it cannot be."""
     try:
-        target_ip = resolver.get_target_ip(edge.id)
-        target_port = edge.target_port
-        target_endpoint = f"{target_ip}:{target_port}"
+        if target_ip is None:
+            target_ip = resolver.get_target_ip(edge.id)
     except ResolutionError as e:
         return HealthCheckResult(
             edge_id=edge.id,
@@ -157,35 +502,22 @@ def check_edge_health(
             check_type="resolution",
             timestamp=timestamp,
         )
+    return target_ip, edge.target_port
 
-    # Determine check type
-    check_config = edge.healthcheck
-    check_type = check_config.type.value
-
-    # Perform appropriate check
-    if check_type == "tcp":
-        healthy, latency, message = check_tcp(target_ip, target_port, timeout)
-    elif check_type in ("http", "https"):
-        path = check_config.path or "/"
-        healthy, latency, message = check_http(
-            target_ip, target_port, path, timeout, https=(check_type == "https")
-        )
-    elif check_type == "ping":
-        # Redis-style ping
-        healthy, latency, message = check_redis_ping(target_ip, target_port, timeout)
-    elif check_type == "api":
-        # Generic API check (HTTP GET)
-        path = check_config.path or "/health"
-        healthy, latency, message = check_http(target_ip, target_port, path, timeout)
-    else:
-        # Default to TCP check
-        healthy, latency, message = check_tcp(target_ip, target_port, timeout)
-        check_type = "tcp"
 
+def _edge_result(
+    edge: Edge,
+    endpoint: tuple[str, int],
+    outcome: tuple[bool, float | None, str | None],
+    check_type: str,
+    timestamp: float,
+) -> HealthCheckResult:
+    """Build the result of a check that ran against a resolved endpoint."""
+    healthy, latency, message = outcome
     return HealthCheckResult(
         edge_id=edge.id,
         edge_type=edge.type.value,
-        target_endpoint=target_endpoint,
+        target_endpoint=f"{endpoint[0]}:{endpoint[1]}",
         healthy=healthy,
         latency_ms=latency,
         message=message,
@@ -195,23 +527,181 @@ def check_edge_health(
     )
 
 
+def check_edge_health(
+    edge: Edge,
+    resolver: EdgeResolver,
+    timeout: int = 5,
+    target_ip: str | None = None,
+    http_pool: HttpConnectionPool | None = None,
+) -> HealthCheckResult:
+    """
+    Perform health check for an edge.
+
+    Automatically selects appropriate check based on edge type and configuration.
+    Pass ``target_ip`` when the target has already been resolved to skip resolution,
+    and ``http_pool`` to keep HTTP connections in a pool of the caller's.
+    """
+    timestamp = time.time()
+
+    endpoint = _resolve_endpoint(edge, resolver, target_ip, timestamp)
+    if isinstance(endpoint, HealthCheckResult):
+        return endpoint
+    ip, port = endpoint
+
+    # Perform appropriate check
+    check_type, path = _plan_check(edge)
+    if check_type == "ping":
+        # Redis-style ping
+        outcome = check_redis_ping(ip, port, timeout)
+    elif path is not None:
+        outcome = check_http(
+            ip, port, path, timeout, https=(check_type == "https"), pool=http_pool
+        )
+    else:
+        outcome = check_tcp(ip, port, timeout)
+
+    return _edge_result(edge, endpoint, outcome, check_type, timestamp)
+
+
+async def check_edge_health_async(
+    edge: Edge,
+    resolver: EdgeResolver,
+    timeout: int = 5,
+    target_ip: str | None = None,
+    http_pool: HttpConnectionPool | None = None,
+) -> HealthCheckResult:
+    """
+    Perform health check for an edge on the running event loop.
+
+    Same check selection as check_edge_health. TCP and Redis checks are native
+    asyncio; HTTP checks run check_http in the loop's default executor.
+    """
+    timestamp = time.time()
+
+    endpoint = _resolve_endpoint(edge, resolver, target_ip, timestamp)
+    if isinstance(endpoint, HealthCheckResult):
+        return endpoint
+    ip, port = endpoint
+
+    check_type, path = _plan_check(edge)
+    if check_type == "ping":
+        outcome = await check_redis_ping_async(ip, port, timeout)
+    elif path is not None:
+        outcome = await asyncio.to_thread(
+            check_http, ip, port, path, timeout, https=(check_type == "https"), pool=http_pool
+        )
+    else:
+        outcome = await check_tcp_async(ip, port, timeout)
+
+    return _edge_result(edge, endpoint, outcome, check_type, timestamp)
+
+
+def resolve_target_ips(edges: list[Edge], resolver: EdgeResolver) -> list[str | None]:
+    """
+    Resolve each edge's target IP, once per target host.
+
+    None marks a target that could not be resolved; the check itself then
+    reports the resolution error for that edge.
+    """
+    by_host: dict[str, str | None] = {}
+    ips: list[str | None] = []
+    for edge in edges:
+        host = edge.target_host
+        if host not in by_host:
+            try:
+                by_host[host] = resolver.get_target_ip(edge.id)
+            except ResolutionError:
+                by_host[host] = None
+        ips.append(by_host[host])
+    return ips
+
+
+# Plain TCP checks beyond this many are probed in one batch_tcp_probe call
+_BATCH_TCP_THRESHOLD = 16
+
+
 def check_all_edges(
     resolver: EdgeResolver,
     timeout: int = 5,
     critical_only: bool = False,
+    edges: Iterable[Edge] | None = None,
 ) -> list[HealthCheckResult]:
     """
-    Check health of all edges.
+    Check health of all edges, or of ``edges`` when given.
+
+    Target IPs are resolved up front, once per target host. Checks then run
+    concurrently in a thread pool; they are network-bound. When more than
+    ``_BATCH_TCP_THRESHOLD`` of the edges to check are plain TCP checks, those
+    are probed together by batch_tcp_probe instead.
 
-    Returns list of HealthCheckResult.
+    Returns list of HealthCheckResult, in edge order.
     """
-    edges = resolver._edges
+    edges = list(resolver._edges if edges is None else edges)
     if critical_only:
-        edges = edges.critical_edges()
+        edges = [e for e in edges if e.is_critical]
+    if not edges:
+        return []
+
+    ips = resolve_target_ips(edges, resolver)
+    results: list[HealthCheckResult | None] = [None] * len(edges)
+    tcp_edges = [i for i, e in enumerate(edges) if _plan_check(e)[0] == "tcp"]
+    if len(tcp_edges) > _BATCH_TCP_THRESHOLD:
+        timestamp = time.time()
+        probes: list[tuple[int, tuple[str, int]]] = []
+        for i in tcp_edges:
+            endpoint = _resolve_endpoint(edges[i], resolver, ips[i], timestamp)
+            if isinstance(endpoint, HealthCheckResult):
+                results[i] = endpoint
+            else:
+                probes.append((i, endpoint))
+        outcomes = batch_tcp_probe([endpoint for _, endpoint in probes], timeout)
+        for (i, endpoint), outcome in zip(probes, outcomes):
+            results[i] = _edge_result(edges[i], endpoint, outcome, "tcp", timestamp)
+
+    pending = [i for i, result in enumerate(results) if result is None]
+    if pending:
+        http_pool = HttpConnectionPool()
+        try:
+            with ThreadPoolExecutor(max_workers=min(64, len(pending))) as ex:
+                checked = ex.map(
+                    lambda i: check_edge_health(edges[i], resolver, timeout, ips[i], http_pool),
+                    pending,
+                )
+                for i, result in zip(pending, checked):
+                    results[i] = result
+        finally:
+            http_pool.close()
+    return results  # type: ignore[return-value]
+
+
+async def check_all_edges_async(
+    resolver: EdgeResolver,
+    timeout: int = 5,
+    critical_only: bool = False,
+    concurrency: int = 256,
+    edges: Iterable[Edge] | None = None,
+) -> list[HealthCheckResult]:
+    """
+    Check health of all edges, or of ``edges`` when given, on the running event loop.
 
-    results = []
-    for edge in edges:
-        result = check_edge_health(edge, resolver, timeout)
-        results.append(result)
+    At most ``concurrency`` checks are in flight at once.
+
+    Returns list of HealthCheckResult, in edge order.
+    """
+    edges = list(resolver._edges if edges is None else edges)
+    if critical_only:
+        edges = [e for e in edges if e.is_critical]
+
+    ips = resolve_target_ips(edges, resolver)
+    semaphore = asyncio.Semaphore(concurrency)
+
+    http_pool = HttpConnectionPool()
 
-    return results
+    async def run(edge: Edge, ip: str | None) -> HealthCheckResult:
+        async with semaphore:
+            return await check_edge_health_async(edge, resolver, timeout, ip, http_pool)
+
+    try:
+        return list(await asyncio.gather(*(run(e, ip) for e, ip in zip(edges, ips))))
+    finally:
+        http_pool.close()
@@ -0,0 +1,66 @@
+"""Tests for analyze command helpers."""
+
+import yaml
+
+from infralink.cli.analyze import _dump_edges
+from infralink.cli.main import Context
+
+
+def _edge(edge_id, host, notes=None):
+    return {
+        "id": edge_id,
+        "type": "queue",
+        "from": {"hosts": [host], "service": "app"},
+        "to": {"host": host, "service": "redis", "port": 6379},
+        "metadata": {"source": "service_dependencies", "notes": notes},
+    }
+
+
+class TestDumpEdges:
+    """Tests for the edges.yml emitter."""
+
+    def test_matches_yaml_dump(self):
+        """Test output is identical to yaml.dump for typical edges."""
+        data = {
+            "schema_version": "1.0",
+            "edges": [
+                _edge("app-to-redis", "d1b9e5d5-36b0-459d-a556-96622811fbd5"),
+                _edge("app-to-cache", "fa2b9872-d94c-4b20-a73a-57a205560769", "cache: hot"),
+            ],
+        }
+        assert _dump_edges(data) == yaml.dump(data, default_flow_style=False, sort_keys=False)
+
+    def test_round_trips_special_scalars(self):
+        """Test values that need quoting load back unchanged."""
+        values = [
+            "yes", "null", "", "123", "1.5", "2001-12-14", "#x", " lead", "it's", "a\nb", "ünï",
+            "foo bar", "-x",
+        ]
+        data = {
+            "schema_version": "1.0",
+            "edges": [_edge(v, v, v) for v in values],
+        }
+        assert yaml.safe_load(_dump_edges(data)) == data
+
+    def test_empty(self):
+        """Test empty edge list."""
+        data = {"schema_version": "1.0", "edges": []}
+        assert yaml.safe_load(_dump_edges(data)) == data
+
+
+class TestContextLoadRaw:
+    """Tests for reading another registry file through the CLI context."""
+
+    def test_other_path_leaves_context_untouched(self, tmp_path):
+        """Test parsing a second registry does not repoint the shared context."""
+        own = tmp_path / "own.yml"
+        own.write_text("hosts:\n  a-b-c-d-e:\n    canonical_name: own\n")
+        other = tmp_path / "other.yml"
+        other.write_text("hosts:\n  f-g-h-i-j:\n    canonical_name: other\n")
+        ctx = Context()
+        ctx.registry_path = own
+
+        assert ctx.load_raw(other)["hosts"]["f-g-h-i-j"]["canonical_name"] == "other"
+        assert ctx.registry_path == own
+        assert ctx.registry.get_by_name("own") is not None
+        assert ctx.load_raw() is ctx.load_raw(own)
@@ -1,7 +1,11 @@
 """Tests for edges module."""
 
+import pickle
+
 import pytest
+import yaml
 
+from infralink import _Dumper, _Loader
 from infralink.core.edges import Edge, EdgeSet
 from infralink.core.schema import EdgeType, Criticality
 
@@ -107,10 +111,59 @@ class TestEdge:
 
     def test_edge_matches_source(self, sample_edge_data):
         """Test source matching."""
+        wildcard_data = {**sample_edge_data, "from": {"hosts": "*"}}
         edge = Edge(sample_edge_data)
 
         assert edge.matches_source("fa2b9872-d94c-4b20-a73a-57a205560769")
         assert not edge.matches_source("nonexistent-uuid")
+        assert edge.source_host_count == 2
+
+        wildcard = Edge(wildcard_data)
+        assert wildcard.matches_source("nonexistent-uuid")
+        assert wildcard.source_host_count == 0
+
+    def test_edge_is_read_only(self, sample_edge_data):
+        """Test that edges reject attribute assignment."""
+        edge = Edge(sample_edge_data)
+
+        with pytest.raises(AttributeError):
+            edge.target_port = 1
+        with pytest.raises(AttributeError):
+            edge.extra = True
+        assert edge.target_port == 5432
+
+    def test_edge_leaves_input_untouched(self, sample_edge_data):
+        """Test that parsing does not rewrite the caller's mapping."""
+        edge = Edge(sample_edge_data)
+
+        assert "from" in sample_edge_data
+        assert "from_" not in sample_edge_data
+        assert edge.to_dict()["to"]["host"] == edge.target_host
+
+    def test_edge_interns_host_uuids(self, sample_edge_data):
+        """Test that equal UUIDs from separate inputs share one string."""
+        target = "".join(sample_edge_data["to"]["host"])
+        other = {**sample_edge_data, "id": "other", "to": {**sample_edge_data["to"], "host": target}}
+
+        assert Edge(other).target_host is Edge(sample_edge_data).target_host
+
+    def test_edge_pickles_after_to_dict(self, sample_edge_data):
+        """Test that slotted edges round-trip through pickle."""
+        edge = Edge(sample_edge_data)
+        data = edge.to_dict()
+
+        assert not hasattr(edge, "__dict__")
+        restored = pickle.loads(pickle.dumps(edge))
+        assert restored.id == edge.id
+        assert restored.to_dict() == data
+
+    def test_edge_to_dict_round_trips_yaml(self, sample_edge_data):
+        """Test edge dicts dump as YAML in the edges file format."""
+        edge = Edge(sample_edge_data)
+
+        dumped = yaml.load(yaml.dump(edge.to_dict(), Dumper=_Dumper), Loader=_Loader)
+        assert dumped == sample_edge_data
+        assert Edge(dumped).to_dict() == edge.to_dict()
 
 
 class TestEdgeSet:
@@ -162,6 +215,35 @@ class TestEdgeSet:
 
         from_app1 = edges.from_host("fa2b9872-d94c-4b20-a73a-57a205560769")
         assert len(from_app1) == 3  # 2 explicit + 1 wildcard
+        assert [e.id for e in from_app1] == ["app-to-postgres", "app-to-redis", "monitoring-scrape"]
+
+        from_unknown = edges.from_host("nonexistent-uuid")
+        assert [e.id for e in from_unknown] == ["monitoring-scrape"]
+
+        from_app1.clear()
+        assert len(edges.from_host("fa2b9872-d94c-4b20-a73a-57a205560769")) == 3
+
+    def test_query_results_are_copies(self, sample_edges_data):
+        """Test mutating a query result leaves the indexes intact."""
+        edges = EdgeSet.from_dict(sample_edges_data)
+        target = "d1b9e5d5-36b0-459d-a556-96622811fbd5"
+
+        edges.targeting_host(target).clear()
+        edges.by_type(EdgeType.DATABASE).clear()
+        edges.critical_edges().clear()
+        edges.from_host("nonexistent-uuid").clear()
+
+        assert len(edges.targeting_host(target)) == 2
+        assert len(edges.by_type(EdgeType.DATABASE)) == 1
+        assert len(edges.critical_edges()) == 1
+        assert [e.id for e in edges.from_host("nonexistent-uuid")] == ["monitoring-scrape"]
+
+    def test_targeting_service(self, sample_edges_data):
+        """Test getting edges targeting a service."""
+        edges = EdgeSet.from_dict(sample_edges_data)
+
+        assert [e.id for e in edges.targeting_service("redis")] == ["app-to-redis"]
+        assert edges.targeting_service("nonexistent") == []
 
     def test_contains(self, sample_edges_data):
         """Test __contains__ method."""
@@ -177,3 +259,11 @@ class TestEdgeSet:
         monitoring = edges.get("monitoring-scrape")
         assert monitoring.is_wildcard_source()
         assert monitoring.source_hosts == []  # Empty for wildcard
+
+    def test_filtered_unindexed_attribute(self, sample_edges_data):
+        """Test querying an attribute without a prebuilt index."""
+        edges = EdgeSet.from_dict(sample_edges_data)
+
+        redis = edges._filtered("protocol", "redis")
+        assert [e.id for e in redis] == ["app-to-redis"]
+        assert edges._filtered("protocol", "redis") is redis
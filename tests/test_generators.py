@@ -0,0 +1,63 @@
+"""Tests for diagram generators."""
+
+from pathlib import Path
+
+from infralink.core.edges import EdgeSet
+from infralink.core.registry import Registry
+from infralink.generators.d2 import generate_d2
+
+EXAMPLES = Path(__file__).parent.parent / "examples"
+
+
+def assert_balanced(text):
+    """Assert every D2 block opened is closed, and never closed early."""
+    depth = 0
+    for char in text:
+        depth += {"{": 1, "}": -1}.get(char, 0)
+        assert depth >= 0
+    assert depth == 0
+
+
+class TestD2:
+    """Tests for the D2 generator."""
+
+    def test_example_registry(self):
+        """Test the example registry renders with balanced single braces."""
+        registry = Registry.load(EXAMPLES / "registry.yml")
+        edges = EdgeSet.load(EXAMPLES / "edges.yml")
+
+        d2 = generate_d2(list(registry), edges, registry)
+
+        assert_balanced(d2)
+        assert "{{" not in d2 and "}}" not in d2
+        assert "production.fa2b9872 -> production.d1b9e5d5: postgresql:5432" in d2
+
+    def test_ungrouped_hosts_and_many_services(self):
+        """Test hosts without a group land in "other" and list at most five services."""
+        app = "fa2b9872-d94c-4b20-a73a-57a205560769"
+        db = "d1b9e5d5-36b0-459d-a556-96622811fbd5"
+        registry = Registry.from_dict({
+            "hosts": {
+                app: {"canonical_name": "app", "group": "production"},
+                db: {
+                    "canonical_name": "db",
+                    "services": [f"svc-{i}" for i in range(7)],
+                },
+            }
+        })
+        edges = EdgeSet.from_dict({
+            "edges": [{
+                "id": "app-to-db",
+                "type": "database",
+                "from": {"hosts": [app]},
+                "to": {"host": db, "service": "svc-0", "port": 5432},
+            }]
+        })
+
+        d2 = generate_d2(list(registry), edges, registry)
+
+        assert_balanced(d2)
+        assert "production.fa2b9872 -> other.d1b9e5d5: svc-0:5432" in d2
+        assert "None." not in d2
+        assert "svc_4: svc-4" in d2
+        assert "svc-5" not in d2
@@ -0,0 +1,377 @@
+"""Tests for health check module."""
+
+import asyncio
+import http.server
+import socket
+import threading
+import time
+
+import pytest
+
+from infralink.core.edges import EdgeSet
+from infralink.core.registry import Registry
+from infralink.core.resolver import EdgeResolver
+from infralink.health import checks
+from infralink.health.checks import (
+    batch_tcp_probe,
+    check_all_edges,
+    check_all_edges_async,
+    check_http,
+    close_http_connections,
+    HealthCheckResult,
+    summarize_latencies,
+)
+
+HOST_UUID = "d1b9e5d5-36b0-459d-a556-96622811fbd5"
+
+
+@pytest.fixture
+def registry():
+    """Create a registry with a single host on the loopback address."""
+    return Registry.from_dict({
+        "hosts": {
+            HOST_UUID: {"canonical_name": "local", "tailscale_ip": "127.0.0.1"},
+        }
+    })
+
+
+@pytest.fixture
+def open_port():
+    """Port of a local socket accepting connections."""
+    with socket.socket() as server:
+        server.bind(("127.0.0.1", 0))
+        server.listen(128)
+        yield server.getsockname()[1]
+
+
+@pytest.fixture
+def closed_port():
+    """Port with nothing listening on it."""
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        return probe.getsockname()[1]
+
+
+class _Handler(http.server.BaseHTTPRequestHandler):
+    """Keep-alive handler; the path picks the response."""
+
+    protocol_version = "HTTP/1.1"
+    statuses = {"/ok": 200, "/moved": 302, "/error": 503, "/close-after": 200}
+
+    def do_GET(self):
+        self.server.clients.append(self.client_address)
+        if self.path == "/slow":
+            # Outlast the client's timeout, then hang up without responding
+            time.sleep(0.3)
+            self.close_connection = True
+            return
+        self.send_response(self.statuses.get(self.path, 404))
+        if self.path == "/moved":
+            self.send_header("Location", "/ok")
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"ok")
+        # Drop the connection without announcing it, as idle timeouts do
+        if self.path == "/close-after":
+            self.close_connection = True
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def http_server():
+    """Local HTTP/1.1 server recording the client address of each request."""
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    server.clients = []
+    thread = threading.Thread(
+        target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True
+    )
+    thread.start()
+    yield server
+    close_http_connections()
+    server.shutdown()
+    server.server_close()
+
+
+def make_edges(ports, criticality="medium", **extra):
+    """Build an edge set with one edge per port, all targeting the local host."""
+    return EdgeSet.from_dict({
+        "edges": [
+            {
+                "id": f"edge-{i}",
+                "type": "api",
+                "from": {"hosts": "*"},
+                "to": {"host": HOST_UUID, "service": "svc", "port": port},
+                "metadata": {"criticality": criticality},
+                **extra,
+            }
+            for i, port in enumerate(ports)
+        ]
+    })
+
+
+def make_result(latency_ms):
+    """Build a check result with the given latency."""
+    return HealthCheckResult(
+        edge_id="edge",
+        edge_type="api",
+        target_endpoint="127.0.0.1:80",
+        healthy=latency_ms is not None,
+        latency_ms=latency_ms,
+        message=None,
+        criticality="medium",
+        check_type="tcp",
+        timestamp=0.0,
+    )
+
+
+class TestSummarizeLatencies:
+    """Tests for summarize_latencies."""
+
+    def test_empty(self):
+        """Test no results, or none with a latency, give no summary."""
+        assert summarize_latencies([]) is None
+        assert summarize_latencies([make_result(None), make_result(None)]) is None
+
+    def test_single_result(self):
+        """Test one latency is every statistic."""
+        assert summarize_latencies([make_result(4.0)]) == (4.0, 4.0, 4.0)
+
+    def test_nearest_rank(self):
+        """Test nearest-rank percentiles, skipping results without a latency."""
+        results = [make_result(float(ms)) for ms in range(20, 0, -1)]
+        results.insert(5, make_result(None))
+
+        # 20 latencies: p50 is the 10th smallest, p95 the 19th
+        assert summarize_latencies(results) == (10.0, 19.0, 10.5)
+
+
+class TestBatchTcpProbe:
+    """Tests for batch_tcp_probe."""
+
+    def test_open_and_closed_ports(self, open_port, closed_port):
+        """Test probes report each target's outcome, in order."""
+        outcomes = batch_tcp_probe([("127.0.0.1", open_port), ("127.0.0.1", closed_port)], 1)
+
+        assert outcomes[0][0] is True
+        assert outcomes[0][1] is not None
+        assert outcomes[1][0] is False
+        assert outcomes[1][2].startswith("Connection refused")
+
+    def test_socket_errors_are_per_target(self, monkeypatch, open_port):
+        """Test running out of sockets fails the target rather than the batch."""
+        real_socket = socket.socket
+        calls = []
+
+        def flaky_socket(*args):
+            calls.append(args)
+            if len(calls) == 2:
+                raise OSError(24, "Too many open files")
+            return real_socket(*args)
+
+        monkeypatch.setattr(checks.socket, "socket", flaky_socket)
+        outcomes = batch_tcp_probe([("127.0.0.1", open_port)] * 3, 1)
+
+        assert [o[0] for o in outcomes] == [True, False, True]
+        assert "Too many open files" in outcomes[1][2]
+
+    def test_in_flight_cap(self, monkeypatch, open_port):
+        """Test more targets than the in-flight cap are all probed."""
+        monkeypatch.setattr(checks, "_PROBE_MAX_IN_FLIGHT", 4)
+        outcomes = batch_tcp_probe([("127.0.0.1", open_port)] * 10, 1)
+
+        assert all(o[0] for o in outcomes)
+
+
+class TestCheckAllEdges:
+    """Tests for check_all_edges."""
+
+    def test_batched_tcp_edges(self, registry, open_port, closed_port):
+        """Test a large set of TCP edges is checked in edge order."""
+        ports = [open_port, closed_port] * 10
+        edges = make_edges(ports)
+
+        results = check_all_edges(EdgeResolver(registry, edges), timeout=1)
+
+        assert [r.edge_id for r in results] == [f"edge-{i}" for i in range(20)]
+        assert [r.healthy for r in results] == [True, False] * 10
+        assert all(r.check_type == "tcp" for r in results)
+        assert results[1].target_endpoint == f"127.0.0.1:{closed_port}"
+
+    def test_critical_only_batches_critical_edges(self, monkeypatch, registry, open_port):
+        """Test critical-only runs batch-probe the critical TCP edges alone."""
+        probed = []
+        real_probe = checks.batch_tcp_probe
+
+        def probe(targets, timeout):
+            probed.append(len(targets))
+            return real_probe(targets, timeout)
+
+        monkeypatch.setattr(checks, "batch_tcp_probe", probe)
+        edges = EdgeSet.from_dict({
+            "edges": [
+                {
+                    "id": f"edge-{i}",
+                    "type": "api",
+                    "from": {"hosts": "*"},
+                    "to": {"host": HOST_UUID, "service": "svc", "port": open_port},
+                    "metadata": {"criticality": "critical" if i % 5 else "low"},
+                }
+                for i in range(25)
+            ]
+        })
+
+        results = check_all_edges(EdgeResolver(registry, edges), timeout=1, critical_only=True)
+
+        assert probed == [20]
+        assert len(results) == 20
+        assert all(r.healthy for r in results)
+
+    def test_http_pool_scoped_to_run(self, monkeypatch, registry, http_server):
+        """Test a run closes its own HTTP connections and leaves check_http's alone."""
+        closed = []
+        real_close = checks.HttpConnectionPool.close
+
+        def close(pool):
+            closed.append(pool)
+            real_close(pool)
+
+        monkeypatch.setattr(checks.HttpConnectionPool, "close", close)
+        port = http_server.server_address[1]
+        edges = make_edges([port] * 2, healthcheck={"type": "http", "path": "/ok"})
+
+        assert check_http("127.0.0.1", port, "/ok", timeout=1)[0]
+        results = check_all_edges(EdgeResolver(registry, edges), timeout=1)
+        assert all(r.healthy for r in results)
+        assert check_http("127.0.0.1", port, "/ok", timeout=1)[0]
+
+        assert len(closed) == 1 and closed[0] is not checks._default_http_pool
+        # The standalone connection was reused across the run
+        standalone = http_server.clients[0]
+        assert http_server.clients[-1] == standalone
+        assert standalone not in http_server.clients[1:-1]
+
+    def test_explicit_edges(self, registry, open_port, closed_port):
+        """Test only the given edges are checked."""
+        edges = make_edges([open_port, closed_port])
+        resolver = EdgeResolver(registry, edges)
+
+        results = check_all_edges(resolver, timeout=1, edges=[edges.get("edge-1")])
+
+        assert [(r.edge_id, r.healthy) for r in results] == [("edge-1", False)]
+
+
+class TestCheckAllEdgesAsync:
+    """Tests for check_all_edges_async."""
+
+    def test_open_and_refused(self, registry, open_port, closed_port):
+        """Test a healthy and a refused TCP edge, in edge order."""
+        edges = make_edges([open_port, closed_port])
+
+        results = asyncio.run(check_all_edges_async(EdgeResolver(registry, edges), timeout=1))
+
+        assert [(r.edge_id, r.healthy, r.check_type) for r in results] == [
+            ("edge-0", True, "tcp"),
+            ("edge-1", False, "tcp"),
+        ]
+        assert results[1].message.startswith("Connection refused")
+
+    def test_explicit_edges(self, registry, open_port, closed_port):
+        """Test only the given edges are checked."""
+        edges = make_edges([open_port, closed_port])
+        resolver = EdgeResolver(registry, edges)
+
+        results = asyncio.run(
+            check_all_edges_async(resolver, timeout=1, edges=[edges.get("edge-1")])
+        )
+
+        assert [(r.edge_id, r.healthy) for r in results] == [("edge-1", False)]
+
+    def test_concurrency_limit(self, monkeypatch, registry):
+        """Test no more than ``concurrency`` checks run at once."""
+        running = 0
+        peak = 0
+
+        async def fake_check(edge, resolver, timeout, target_ip, http_pool):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return edge.id
+
+        monkeypatch.setattr(checks, "check_edge_health_async", fake_check)
+        edges = make_edges([1] * 10)
+
+        results = asyncio.run(
+            check_all_edges_async(EdgeResolver(registry, edges), concurrency=3)
+        )
+
+        assert results == [f"edge-{i}" for i in range(10)]
+        assert peak == 3
+
+
+class TestCheckHttp:
+    """Tests for check_http and its keep-alive connections."""
+
+    def test_connection_reused(self, http_server):
+        """Test repeated checks of one target share a connection."""
+        port = http_server.server_address[1]
+
+        assert check_http("127.0.0.1", port, "/ok", timeout=1)[0]
+        assert check_http("127.0.0.1", port, "/ok", timeout=1)[0]
+        assert len(set(http_server.clients)) == 1
+
+        close_http_connections()
+        assert check_http("127.0.0.1", port, "/ok", timeout=1)[0]
+        assert len(set(http_server.clients)) == 2
+
+    def test_retry_after_server_close(self, http_server):
+        """Test a connection closed by the server is replaced transparently."""
+        port = http_server.server_address[1]
+
+        assert check_http("127.0.0.1", port, "/close-after", timeout=1)[0]
+        healthy, latency, message = check_http("127.0.0.1", port, "/ok", timeout=1)
+
+        assert healthy, message
+        assert len(set(http_server.clients)) == 2
+
+    def test_timeout_not_retried(self, http_server):
+        """Test a timed-out request on a reused connection fails without a retry."""
+        port = http_server.server_address[1]
+
+        assert check_http("127.0.0.1", port, "/ok", timeout=1)[0]
+        healthy, latency, message = check_http("127.0.0.1", port, "/slow", timeout=0.1)
+
+        assert not healthy
+        assert "timed out" in message
+        assert len(http_server.clients) == 2
+
+    def test_large_body_not_reused(self, monkeypatch, http_server):
+        """Test a body past the drain limit closes the connection."""
+        monkeypatch.setattr(checks, "_HTTP_DRAIN_LIMIT", 1)
+        port = http_server.server_address[1]
+
+        assert check_http("127.0.0.1", port, "/ok", timeout=1)[0]
+        assert check_http("127.0.0.1", port, "/ok", timeout=1)[0]
+        assert len(set(http_server.clients)) == 2
+
+    def test_status_classification(self, http_server):
+        """Test redirects count as healthy and server errors do not."""
+        port = http_server.server_address[1]
+
+        healthy, latency, message = check_http("127.0.0.1", port, "/moved", timeout=1)
+        assert healthy and latency is not None and message is None
+        assert check_http("127.0.0.1", port, "/error", timeout=1) == (
+            False,
+            None,
+            "HTTP 503: Service Unavailable",
+        )
+
+    def test_refused(self, closed_port):
+        """Test an unreachable target reports the connection error."""
+        healthy, latency, message = check_http("127.0.0.1", closed_port, timeout=1)
+
+        assert not healthy
+        assert message.startswith("URL error:")
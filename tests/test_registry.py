@@ -1,10 +1,12 @@
 """Tests for registry module."""
 
 import pytest
+import yaml
 from pathlib import Path
 
+from infralink import _Dumper, _Loader
 from infralink.core.registry import Registry, Host
-from infralink.core.schema import HostStatus
+from infralink.core.schema import HostSchema, HostStatus
 
 
 @pytest.fixture
@@ -62,6 +64,28 @@ class TestHost:
         assert host.cloud == "hetzner-cloud"
         assert host.tailscale_ip == "100.78.109.111"
 
+    def test_host_from_schema(self, sample_registry_data):
+        """Test a host built from an already-validated schema."""
+        uuid = "d1b9e5d5-36b0-459d-a556-96622811fbd5"
+        schema = HostSchema.model_validate(sample_registry_data["hosts"][uuid])
+        host = Host(uuid, schema=schema)
+
+        assert host.canonical_name == "test-host-1"
+        assert host.to_dict()["uuid"] == uuid
+
+        with pytest.raises(TypeError):
+            Host(uuid)
+
+    def test_observability_ready(self):
+        """Test observability readiness flag."""
+        uuid = "d1b9e5d5-36b0-459d-a556-96622811fbd5"
+
+        assert not Host(uuid, {"canonical_name": "a"}).observability_ready
+        assert not Host(uuid, {"canonical_name": "b", "observability": {}}).observability_ready
+        assert Host(
+            uuid, {"canonical_name": "c", "observability": {"ready": True}}
+        ).observability_ready
+
     def test_host_services(self, sample_registry_data):
         """Test host service queries."""
         uuid = "d1b9e5d5-36b0-459d-a556-96622811fbd5"
@@ -72,6 +96,53 @@ class TestHost:
         assert host.has_service("redis")
         assert not host.has_service("nginx")
 
+    def test_host_roles(self):
+        """Test role membership, including legacy role mappings."""
+        uuid = "d1b9e5d5-36b0-459d-a556-96622811fbd5"
+        host = Host(uuid, {"canonical_name": "w", "roles": {"airflow-worker": {"concurrency": 10}}})
+
+        assert host.roles == ["airflow-worker"]
+        assert host.has_role("airflow-worker")
+        assert not host.has_role("postgres")
+
+    def test_host_service_config_defaults(self):
+        """Test service configs report defaults for undeclared keys."""
+        uuid = "d1b9e5d5-36b0-459d-a556-96622811fbd5"
+        host = Host(uuid, {"canonical_name": "web", "services": {"nginx": {"port": 80}, "app": {}}})
+
+        assert host.get_service_port("nginx") == 80
+        assert host.get_service_port("app") is None
+        assert host.get_service("app") == {
+            "port": None,
+            "protocol": "tcp",
+            "exposure": "internal",
+            "depends_on": [],
+            "notes": None,
+        }
+        assert host.to_dict()["services"] == {"nginx": {"port": 80}, "app": {}}
+
+    def test_host_to_dict_dumps_as_yaml(self, sample_registry_data):
+        """Test host dicts hold plain values that the YAML dumper accepts."""
+        uuid = "d1b9e5d5-36b0-459d-a556-96622811fbd5"
+        data = {**sample_registry_data["hosts"][uuid], "services": {"nginx": {"exposure": "public"}}}
+        host = Host(uuid, data)
+
+        dumped = yaml.load(yaml.dump(host.to_dict(), Dumper=_Dumper), Loader=_Loader)
+        assert dumped["status"] == "active"
+        assert dumped["services"] == {"nginx": {"exposure": "public"}}
+        assert "dns_hostnames" not in dumped
+
+    def test_host_is_read_only(self, sample_registry_data):
+        """Test that hosts reject attribute assignment."""
+        uuid = "d1b9e5d5-36b0-459d-a556-96622811fbd5"
+        host = Host(uuid, sample_registry_data["hosts"][uuid])
+
+        with pytest.raises(AttributeError):
+            host.group = "staging"
+        with pytest.raises(AttributeError):
+            host.extra = True
+        assert host.group == "production"
+
     def test_host_get_ip(self, sample_registry_data):
         """Test IP address retrieval with fallback."""
         uuid = "d1b9e5d5-36b0-459d-a556-96622811fbd5"
@@ -82,6 +153,12 @@ class TestHost:
         # Falls back to tailscale_ip when public_ip is not defined
         assert host.get_ip("public") == "100.78.109.111"
 
+        host = Host(uuid, {"canonical_name": "lan-only", "private_ip": "10.0.0.5"})
+        assert host.get_ip("tailscale") == "10.0.0.5"
+        assert host.get_ip("private") == "10.0.0.5"
+        # Unknown preferences return the tailscale address without fallback
+        assert host.get_ip("other") is None
+
 
 class TestRegistry:
     """Tests for Registry class."""
@@ -109,6 +186,25 @@ class TestRegistry:
         assert host is not None
         assert host.canonical_name == "test-host-1"
 
+        assert registry.get_by_uuid_prefix("fa2") is registry.get_by_name("test-host-2")
+        assert registry.get_by_uuid_prefix("e1a2b3c4-d5e6") is registry.get_by_name("terminated-host")
+        assert registry.get_by_uuid_prefix("d1b9f") is None
+
+    def test_get_by_uuid_prefix_ambiguous(self):
+        """Test an ambiguous prefix resolves to the host declared first."""
+        registry = Registry.from_dict(
+            {
+                "hosts": {
+                    "abcd1234-ffff-4000-8000-000000000000": {"canonical_name": "second-sorted"},
+                    "abcd1234-0000-4000-8000-000000000000": {"canonical_name": "first-sorted"},
+                }
+            }
+        )
+
+        assert registry.get_by_uuid_prefix("abcd12").canonical_name == "second-sorted"
+        assert registry.get_by_uuid_prefix("abcd1234").canonical_name == "second-sorted"
+        assert registry.get_by_uuid_prefix("abcd1234-0").canonical_name == "first-sorted"
+
     def test_get_by_name(self, sample_registry_data):
         """Test host lookup by name."""
         registry = Registry.from_dict(sample_registry_data)
@@ -116,6 +212,8 @@ class TestRegistry:
         host = registry.get_by_name("test-host-1")
         assert host is not None
         assert host.uuid_prefix == "d1b9e5d5"
+        assert registry.get_by_name(host.uuid) is None
+        assert registry.get_by_name("nonexistent") is None
 
     def test_filter_by_status(self, sample_registry_data):
         """Test filtering by status."""
@@ -127,6 +225,10 @@ class TestRegistry:
         terminated = registry.filter(status=HostStatus.TERMINATED)
         assert len(terminated) == 1
 
+        # Status buckets also answer plain strings and unused statuses
+        assert registry.filter(status="active") == registry.active_hosts()
+        assert registry.filter(status=HostStatus.MAINTENANCE) == []
+
     def test_filter_by_group(self, sample_registry_data):
         """Test filtering by group."""
         registry = Registry.from_dict(sample_registry_data)
@@ -137,6 +239,16 @@ class TestRegistry:
         staging = registry.filter(group="staging")
         assert len(staging) == 1
 
+    def test_filter_combined(self, sample_registry_data):
+        """Test combined criteria intersect and keep registry order."""
+        registry = Registry.from_dict(sample_registry_data)
+
+        hosts = registry.filter(status=HostStatus.ACTIVE, group="production", cloud="hetzner-cloud")
+        assert [h.canonical_name for h in hosts] == ["test-host-1", "test-host-2"]
+
+        assert registry.filter(status=HostStatus.TERMINATED, group="production") == []
+        assert len(registry.filter()) == len(registry)
+
     def test_filter_by_service(self, sample_registry_data):
         """Test filtering by service."""
         registry = Registry.from_dict(sample_registry_data)
@@ -145,6 +257,21 @@ class TestRegistry:
         assert len(postgres_hosts) == 1
         assert postgres_hosts[0].canonical_name == "test-host-1"
 
+        assert registry.filter(service="nginx", group="production") == [
+            registry.get_by_name("test-host-2")
+        ]
+        assert registry.filter(service="nginx", group="staging") == []
+        assert registry.filter(service="nonexistent", group="production") == []
+
+    def test_observability_ready_hosts(self, sample_registry_data):
+        """Test only active, observable hosts are listed."""
+        hosts = sample_registry_data["hosts"]
+        hosts["fa2b9872-d94c-4b20-a73a-57a205560769"]["observability"] = {"ready": True}
+        hosts["e1a2b3c4-d5e6-4f7a-8b9c-0d1e2f3a4b5c"]["observability"] = {"ready": True}
+        registry = Registry.from_dict(sample_registry_data)
+
+        assert registry.observability_ready_hosts() == [registry.get_by_name("test-host-2")]
+
     def test_groups(self, sample_registry_data):
         """Test getting unique groups."""
         registry = Registry.from_dict(sample_registry_data)
@@ -159,10 +286,94 @@ class TestRegistry:
         clouds = registry.clouds()
         assert clouds == {"hetzner-cloud", "gcp"}
 
+    def test_groups_and_clouds_skip_unset(self, sample_registry_data):
+        """Test hosts without a group or cloud add nothing, and the sets are reused."""
+        sample_registry_data["hosts"]["c0ffee00-0000-4000-8000-000000000000"] = {
+            "canonical_name": "ungrouped"
+        }
+        registry = Registry.from_dict(sample_registry_data)
+
+        assert registry.groups() == {"production", "staging"}
+        assert registry.clouds() == {"hetzner-cloud", "gcp"}
+        assert registry.groups() is registry.groups()
+
     def test_contains(self, sample_registry_data):
         """Test __contains__ method."""
         registry = Registry.from_dict(sample_registry_data)
 
         assert "d1b9e5d5-36b0-459d-a556-96622811fbd5" in registry
         assert "test-host-1" in registry
+        assert "d1b9e5d5" in registry
+        assert "d1b9" in registry
         assert "nonexistent" not in registry
+        assert 42 not in registry
+
+    def test_contains_agrees_with_get(self, sample_registry_data):
+        """Test ``in`` matches get() for UUID prefixes of any length."""
+        registry = Registry.from_dict(sample_registry_data)
+
+        for identifier in ("d1b", "d1b9e", "d1b9e5d5-36b", "fff", "fffff", "ffffffff-fff"):
+            assert (identifier in registry) == (registry.get(identifier) is not None)
+        assert "d1b9e5d5-36b" in registry
+
+    def test_get_precedence(self):
+        """Test get() tries full UUID, then UUID prefix, then canonical name."""
+        registry = Registry.from_dict(
+            {
+                "hosts": {
+                    "d1b9e5d5-36b0-459d-a556-96622811fbd5": {"canonical_name": "fa2b9872"},
+                    "fa2b9872-d94c-4b20-a73a-57a205560769": {"canonical_name": "web"},
+                }
+            }
+        )
+
+        assert registry.get("d1b9e5d5-36b0-459d-a556-96622811fbd5").canonical_name == "fa2b9872"
+        # A UUID prefix wins over a host whose name looks like one
+        assert registry.get("fa2b9872").canonical_name == "web"
+        assert registry.get("web").uuid_prefix == "fa2b9872"
+        assert registry.get("nonexistent") is None
+
+    def test_from_raw_validates_uuid_keys(self, sample_registry_data):
+        """Test schema-validated construction from parsed YAML."""
+        registry = Registry.from_raw(sample_registry_data)
+        assert len(registry) == 3
+
+        with pytest.raises(ValueError):
+            Registry.from_raw({"hosts": {"not-a-uuid": {"canonical_name": "bad"}}})
+
+        # The check is loose: five dash-separated parts of any length
+        loose = Registry.from_raw({"hosts": {"host-a-b-c-1": {"canonical_name": "legacy"}}})
+        assert loose.get_by_name("legacy").uuid == "host-a-b-c-1"
+
+    def test_load_reuses_unchanged_file(self, tmp_path, sample_registry_data):
+        """Test repeated loads of an unchanged file return the same registry."""
+        import yaml
+
+        path = tmp_path / "registry.yml"
+        path.write_text(yaml.safe_dump(sample_registry_data))
+
+        registry = Registry.load(path)
+        assert Registry.load(path) is registry
+
+        # Keyed on content, so an identical copy elsewhere is a hit too
+        copy = tmp_path / "copy.yml"
+        copy.write_bytes(path.read_bytes())
+        assert Registry.load(copy) is registry
+
+        del sample_registry_data["hosts"]["e1a2b3c4-d5e6-4f7a-8b9c-0d1e2f3a4b5c"]
+        path.write_text(yaml.safe_dump(sample_registry_data))
+        reloaded = Registry.load(path)
+        assert reloaded is not registry
+        assert len(reloaded) == 2
+
+    def test_load_decodes_utf8_bytes(self, tmp_path):
+        """Test the loader decodes non-ASCII registry content from raw bytes."""
+        path = tmp_path / "registry.yml"
+        path.write_bytes(
+            "hosts:\n"
+            "  d1b9e5d5-36b0-459d-a556-96622811fbd5:\n"
+            "    canonical_name: hôte-münchen\n".encode("utf-8")
+        )
+
+        registry = Registry.load(path)
+        assert registry.get_by_name("hôte-münchen") is not None